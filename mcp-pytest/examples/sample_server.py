@@ -36,6 +36,19 @@ async def list_tools():
                 "required": ["message"],
             },
         ),
+        Tool(
+            name="echo_json",
+            description="Echo back the input data as JSON",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "data": {
+                        "description": "Value to return as JSON",
+                    }
+                },
+                "required": ["data"],
+            },
+        ),
         Tool(
             name="add",
             description="Add two numbers",
@@ -95,6 +108,9 @@ async def call_tool(name: str, arguments: dict):
         message = arguments.get("message", "")
         return [TextContent(type="text", text=f"Echo: {message}")]
 
+    elif name == "echo_json":
+        return [TextContent(type="text", text=json.dumps(arguments.get("data")))]
+
     elif name == "add":
         a = arguments.get("a", 0)
         b = arguments.get("b", 0)
@@ -0,0 +1,256 @@
+"""
+Tests for the mcp-pytest plugin options.
+
+Each test runs a small pytest session against the sample server using
+pytester, so the options are checked the way a project would use them.
+The xdist grouping of the UE suite's conftest is checked the same way.
+
+Run with:
+    cd examples
+    pytest test_plugin.py -v
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+from mcp_pytest import ServerConfig
+from mcp_pytest.client.tools_cache import ToolsCache
+
+pytest_plugins = ["pytester"]
+
+
+SAMPLE_SERVER = Path(__file__).with_name("sample_server.py")
+
+SAMPLE_SERVER_CONFIG = {
+    "name": "sample",
+    "command": sys.executable,
+    "args": [str(SAMPLE_SERVER)],
+    "startup_timeout": 10,
+}
+
+# Inner test that reports how many tools/list requests reached the server
+LIST_TOOLS_TEST = """
+from mcp_pytest.logging.mcp_logger import MessageDirection
+
+
+async def test_list_tools(mcp_client, mcp_logger):
+    tools = await mcp_client.list_tools()
+    assert "echo" in [t.name for t in tools]
+
+    requests = mcp_logger.get_messages(direction=MessageDirection.REQUEST)
+    print(f"tools/list requests: {sum(m.method == 'tools/list' for m in requests)}")
+"""
+
+_TOOLS_LIST_REQUESTS = re.compile(r"tools/list requests: (\d+)")
+
+# Inner test that reports how many server connections were opened so far
+CONNECTIONS_TEST = """
+from mcp_pytest.logging.mcp_logger import MessageDirection
+
+
+async def test_connections(mcp_client, mcp_logger):
+    assert mcp_client.is_connected
+
+    messages = mcp_logger.get_messages(direction=MessageDirection.CONNECTION)
+    print(f"connections: {sum(m.method == 'connection/connected' for m in messages)}")
+"""
+
+_CONNECTIONS = re.compile(r"connections: (\d+)")
+
+
+def _write_project(pytester: pytest.Pytester, **ini: str) -> None:
+    """Write an MCP config for the sample server and a pytest.ini with extra options."""
+    config = {"servers": [SAMPLE_SERVER_CONFIG], "log_level": "WARNING"}
+    pytester.path.joinpath("mcp_servers.yaml").write_text(yaml.safe_dump(config))
+
+    options = {
+        "asyncio_mode": "auto",
+        "asyncio_default_fixture_loop_scope": "session",
+        "asyncio_default_test_loop_scope": "session",
+        "mcp_log_messages": "false",
+        **ini,
+    }
+    pytester.makeini("[pytest]\n" + "".join(f"{k} = {v}\n" for k, v in options.items()))
+
+
+def _run(pytester: pytest.Pytester, pytestconfig: pytest.Config, *args: str):
+    """Run pytest in-process, loading the plugin unless it is installed."""
+    if not pytestconfig.pluginmanager.has_plugin("mcp_pytest"):
+        args = ("-p", "mcp_pytest.plugin", *args)
+    return pytester.runpytest("-s", *args)
+
+
+def _tools_list_requests(result) -> int:
+    """Number of tools/list requests reported by LIST_TOOLS_TEST."""
+    result.assert_outcomes(passed=1)
+    match = _TOOLS_LIST_REQUESTS.search(result.stdout.str())
+    assert match is not None, result.stdout.str()
+    return int(match.group(1))
+
+
+# =============================================================================
+# Tool Listing Cache Tests
+# =============================================================================
+
+
+@pytest.fixture
+def cached_project(pytester):
+    """A project with mcp_cache_tools enabled and one tool-listing test."""
+    _write_project(pytester, mcp_cache_tools="true")
+    pytester.makepyfile(test_tools=LIST_TOOLS_TEST)
+    return pytester
+
+
+def _cache_entries(pytester: pytest.Pytester) -> list[Path]:
+    """Tool listing entries stored in the project's .pytest_cache."""
+    return sorted(pytester.path.joinpath(".pytest_cache", "v", ToolsCache.KEY_PREFIX).iterdir())
+
+
+def test_tools_cache_hit_on_second_run(cached_project, pytestconfig):
+    """Test that a second run reads the tool listing from the cache."""
+    assert _tools_list_requests(_run(cached_project, pytestconfig)) == 1
+    assert len(_cache_entries(cached_project)) == 1
+
+    assert _tools_list_requests(_run(cached_project, pytestconfig)) == 0
+
+
+def test_tools_cache_refresh_option(cached_project, pytestconfig):
+    """Test that --mcp-refresh-tools asks the server again."""
+    _run(cached_project, pytestconfig)
+
+    result = _run(cached_project, pytestconfig, "--mcp-refresh-tools")
+    assert _tools_list_requests(result) == 1
+
+    # The refreshed listing is stored again for later runs
+    assert _tools_list_requests(_run(cached_project, pytestconfig)) == 0
+
+
+@pytest.mark.parametrize(
+    "stored",
+    [
+        pytest.param("{not json", id="corrupt"),
+        pytest.param('{"version": 0, "tools": []}', id="old-version"),
+        pytest.param('{"version": 1, "tools": [{"name": 1}]}', id="bad-tools"),
+    ],
+)
+def test_tools_cache_unreadable_entry(cached_project, pytestconfig, stored):
+    """Test that an unusable cache entry falls back to the server."""
+    _run(cached_project, pytestconfig)
+    (entry,) = _cache_entries(cached_project)
+    entry.write_text(stored)
+
+    assert _tools_list_requests(_run(cached_project, pytestconfig)) == 1
+
+
+def test_tools_cache_disabled_by_default(pytester, pytestconfig):
+    """Test that tool listings are not cached unless mcp_cache_tools is set."""
+    _write_project(pytester)
+    pytester.makepyfile(test_tools=LIST_TOOLS_TEST)
+
+    _run(pytester, pytestconfig)
+    assert _tools_list_requests(_run(pytester, pytestconfig)) == 1
+
+
+def test_tools_cache_key():
+    """Test that the cache key follows the server's launch settings."""
+    config = ServerConfig(**SAMPLE_SERVER_CONFIG)
+    key = ToolsCache.key_for(config)
+
+    assert key.startswith(f"{ToolsCache.KEY_PREFIX}/")
+    assert ToolsCache.key_for(config.model_copy(update={"startup_timeout": 30})) == key
+
+    changed = [
+        {"args": [str(SAMPLE_SERVER), "--verbose"]},
+        {"env": {"SAMPLE_MODE": "1"}},
+        {"cwd": SAMPLE_SERVER.parent},
+        {"command": "python3"},
+    ]
+    for update in changed:
+        assert ToolsCache.key_for(config.model_copy(update=update)) != key, update
+
+
+# =============================================================================
+# Server Scope Tests
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "scope, connections",
+    [
+        pytest.param(None, [1, 2], id="default"),
+        pytest.param("module", [1, 2], id="module"),
+        pytest.param("session", [1, 1], id="session"),
+    ],
+)
+def test_server_scope(pytester, pytestconfig, scope, connections):
+    """Test that mcp_server_scope decides how many modules share a connection."""
+    ini = {"mcp_server_scope": scope} if scope else {}
+    _write_project(pytester, **ini)
+    pytester.makepyfile(test_a=CONNECTIONS_TEST, test_b=CONNECTIONS_TEST)
+
+    result = _run(pytester, pytestconfig)
+    result.assert_outcomes(passed=2)
+    assert [int(n) for n in _CONNECTIONS.findall(result.stdout.str())] == connections
+
+
+def test_server_scope_invalid(pytester, pytestconfig):
+    """Test that an unknown mcp_server_scope is rejected as a usage error."""
+    _write_project(pytester, mcp_server_scope="function")
+    pytester.makepyfile(test_a=CONNECTIONS_TEST)
+
+    result = _run(pytester, pytestconfig)
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(
+        ["*mcp_server_scope must be one of module, package, session, got 'function'*"]
+    )
+
+
+# =============================================================================
+# UE Suite Editor Grouping Tests
+# =============================================================================
+
+
+UE_CONFTEST = Path(__file__).parents[1] / "tests" / "ue_mcp_test" / "conftest.py"
+
+# Inner tests with and without an editor marker, enough to spread over workers
+EDITOR_GROUPING_TEST = """
+import pytest
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("i", range(4))
+def test_editor(i):
+    pass
+
+
+@pytest.mark.parametrize("i", range(4))
+def test_schema(i):
+    pass
+"""
+
+_XDIST_PASSED = re.compile(r"\[(gw\d+)\].* PASSED (\S+)")
+
+
+def test_ue_editor_tests_share_one_xdist_worker(pytester, pytestconfig, monkeypatch):
+    """Test that the UE conftest puts every editor test in the ue_editor xdist group."""
+    pytest.importorskip("xdist")
+    monkeypatch.delenv("UE_EDITOR_STATUS", raising=False)
+    _write_project(pytester, mcp_server_scope="session")
+    pytester.makeconftest(UE_CONFTEST.read_text())
+    pytester.makepyfile(test_grouping=EDITOR_GROUPING_TEST)
+
+    result = _run(pytester, pytestconfig, "-v", "-n", "2", "--dist", "loadgroup")
+    result.assert_outcomes(passed=8)
+
+    workers: dict[str, set[str]] = {}
+    for worker, nodeid in _XDIST_PASSED.findall(result.stdout.str()):
+        workers.setdefault(nodeid, set()).add(worker)
+
+    editor = {n: w for n, w in workers.items() if "::test_editor[" in n}
+    assert sorted(editor) == [f"test_grouping.py::test_editor[{i}]@ue_editor" for i in range(4)]
+    assert len(set().union(*editor.values())) == 1, editor
+    assert not any("@" in n for n in workers if "::test_schema[" in n)
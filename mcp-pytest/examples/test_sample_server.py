@@ -6,12 +6,19 @@ Run with:
     pytest test_sample_server.py -v --mcp-config=mcp_servers_sample.yaml
 """
 
+import json
+import traceback
+
 import pytest
 
+import mcp_pytest.client.tool_caller as tool_caller_module
 from mcp_pytest import (
     CustomAssertion,
     DurationAssertion,
     ErrorAssertion,
+    JsonFieldContainsAssertion,
+    JsonFieldEqualsAssertion,
+    JsonFieldsPresentAssertion,
     ResultContainsAssertion,
     ResultMatchesAssertion,
     SuccessAssertion,
@@ -30,6 +37,7 @@ async def test_list_tools(mcp_client):
 
     tool_names = [t.name for t in tools]
     assert "echo" in tool_names
+    assert "echo_json" in tool_names
     assert "add" in tool_names
     assert "get_time" in tool_names
     assert "slow_operation" in tool_names
@@ -243,6 +251,241 @@ async def test_call_history(tool_caller):
     assert len(echo_calls) == 2
 
 
+@pytest.mark.asyncio
+async def test_call_many(tool_caller):
+    """Test concurrent calls return results in request order."""
+    results = await tool_caller.call_many(
+        [
+            ("echo", {"message": "first"}),
+            ("add", {"a": 1, "b": 2}),
+            ("echo", {"message": "third"}),
+        ],
+        max_concurrency=2,
+    )
+
+    assert [r.name for r in results] == ["echo", "add", "echo"]
+    assert all(r.success for r in results)
+    assert "third" in results[2].text_content
+    assert len(tool_caller.call_history) == 3
+
+
+@pytest.mark.asyncio
+async def test_calls_by_tool(tool_caller):
+    """Test that per-tool lookups follow the call history, including after clearing."""
+    assert tool_caller.get_last_call_for_tool("echo") is None
+    assert tool_caller.get_calls_for_tool("echo") == []
+
+    await tool_caller.call("echo", {"message": "first"})
+    await tool_caller.call("add", {"a": 1, "b": 2})
+    await tool_caller.call_many([("echo", {"message": "second"}), ("add", {"a": 3, "b": 4})])
+    await tool_caller.call("echo", {"message": "third"})
+
+    echo_calls = tool_caller.get_calls_for_tool("echo")
+    assert [c.arguments["message"] for c in echo_calls] == ["first", "second", "third"]
+    assert echo_calls == [c for c in tool_caller.call_history if c.name == "echo"]
+    assert tool_caller.get_last_call_for_tool("echo") is echo_calls[-1]
+    assert tool_caller.get_last_call_for_tool("add").arguments == {"a": 3, "b": 4}
+    assert tool_caller.get_last_call_for_tool("get_time") is None
+
+    # The returned list is a copy; changing it leaves the index intact
+    echo_calls.clear()
+    assert len(tool_caller.get_calls_for_tool("echo")) == 3
+
+    tool_caller.clear_history()
+    assert tool_caller.call_history == []
+    assert tool_caller.get_calls_for_tool("echo") == []
+    assert tool_caller.get_last_call_for_tool("add") is None
+
+    await tool_caller.call("add", {"a": 5, "b": 6})
+    assert [c.arguments for c in tool_caller.get_calls_for_tool("add")] == [{"a": 5, "b": 6}]
+    assert tool_caller.get_last_call_for_tool("echo") is None
+
+
+# =============================================================================
+# JSON Result Tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_json_content_decode_error(tool_caller):
+    """Test that a non-JSON body raises a fresh decode error on every access."""
+    result = await tool_caller.call("echo", {"message": "not json"})
+
+    errors = []
+    for _ in range(3):
+        with pytest.raises(json.JSONDecodeError) as excinfo:
+            _ = result.json_content
+        errors.append(excinfo.value)
+
+    assert errors[1] is not errors[2]
+    assert errors[1].pos == errors[2].pos == 0
+    # Re-raising one cached instance would grow its traceback on each access
+    depths = [len(list(traceback.walk_tb(e.__traceback__))) for e in errors[1:]]
+    assert depths[0] == depths[1]
+
+
+# Payload returned by echo_json in the JSON assertion tests
+SAMPLE_JSON = {"status": "ready", "output": "Hello World", "count": 3}
+
+
+@pytest.mark.asyncio
+async def test_json_field_assertions(tool_caller):
+    """Test JSON field assertions on a JSON object result."""
+    await tool_caller.call_and_assert(
+        "echo_json",
+        arguments={"data": SAMPLE_JSON},
+        assertions=[
+            JsonFieldEqualsAssertion("status", "ready"),
+            JsonFieldEqualsAssertion("count", 3),
+            JsonFieldContainsAssertion("output", "Hello"),
+            JsonFieldContainsAssertion("output", "hello world", case_sensitive=False),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_json_field_assertion_failures(tool_caller):
+    """Test JSON field assertion failure messages."""
+    result = await tool_caller.call("echo_json", {"data": SAMPLE_JSON})
+
+    cases = [
+        (JsonFieldEqualsAssertion("status", "stopped"), "Field 'status' should equal 'stopped'"),
+        (JsonFieldEqualsAssertion("missing", 1), "JSON object with field 'missing'"),
+        (JsonFieldContainsAssertion("output", "Bye"), "Field 'output' should contain 'Bye'"),
+        (JsonFieldContainsAssertion("count", "3"), "should have string field 'count'"),
+        (JsonFieldContainsAssertion("missing", "x"), "should have string field 'missing'"),
+    ]
+    for assertion, message in cases:
+        outcome = assertion.check(result)
+        assert not outcome.passed, assertion
+        assert message in outcome.message, outcome
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "tool, arguments",
+    [
+        pytest.param("echo", {"message": "not json"}, id="text"),
+        pytest.param("echo_json", {"data": ["status", "ready"]}, id="array"),
+        pytest.param("echo_json", {"data": "status"}, id="string"),
+    ],
+)
+async def test_json_field_assertions_non_object(tool_caller, tool, arguments):
+    """Test that JSON field assertions fail on results that are not JSON objects."""
+    result = await tool_caller.call(tool, arguments)
+
+    outcome = JsonFieldEqualsAssertion("status", "ready").check(result)
+    assert not outcome.passed
+    assert "JSON object" in outcome.message
+
+    outcome = JsonFieldContainsAssertion("status", "ready").check(result)
+    assert not outcome.passed
+    assert "string field 'status'" in outcome.message
+
+
+@pytest.mark.asyncio
+async def test_json_fields_present_assertion(tool_caller):
+    """Test JsonFieldsPresentAssertion with all-of and any-of field sets."""
+    result = await tool_caller.call("echo_json", {"data": SAMPLE_JSON})
+
+    assert JsonFieldsPresentAssertion(["status", "count"]).check(result).passed
+    assert JsonFieldsPresentAssertion(["status", "error"], require_all=False).check(result).passed
+
+    outcome = JsonFieldsPresentAssertion(["status", "error"]).check(result)
+    assert not outcome.passed
+    assert outcome.message == "Result should have all of fields: error, status"
+    assert outcome.actual == "count, output, status"
+
+    outcome = JsonFieldsPresentAssertion(["error", "message"], require_all=False).check(result)
+    assert not outcome.passed
+    assert outcome.message == "Result should have any of fields: error, message"
+
+
+@pytest.mark.asyncio
+async def test_json_fields_present_non_object(tool_caller, monkeypatch):
+    """Test that bodies that cannot be JSON objects are rejected without decoding."""
+    decoded = []
+
+    def counting_loads(text):
+        decoded.append(text)
+        return json.loads(text)
+
+    monkeypatch.setattr(tool_caller_module, "_json_loads", counting_loads)
+    assertion = JsonFieldsPresentAssertion(["status"], require_all=False)
+
+    for tool, arguments in [
+        ("echo", {"message": "not json"}),
+        ("echo_json", {"data": ["status"]}),
+    ]:
+        result = await tool_caller.call(tool, arguments)
+        outcome = assertion.check(result)
+        assert not outcome.passed
+        assert outcome.message == "Result should be a JSON object"
+
+    assert decoded == []
+
+    # An object body is decoded once and shared by later checks
+    result = await tool_caller.call("echo_json", {"data": SAMPLE_JSON})
+    assert assertion.check(result).passed
+    assert JsonFieldEqualsAssertion("status", "ready").check(result).passed
+    assert len(decoded) == 1
+
+
+@pytest.mark.asyncio
+async def test_custom_assertion_parse_json(tool_caller):
+    """Test that parse_json passes the decoded payload to both callables."""
+    messages = []
+
+    def describe_failure(data):
+        messages.append(data)
+        return f"status is {data['status']}"
+
+    is_ready = CustomAssertion(
+        check_func=lambda data: data["status"] == "ready",
+        description="Status should be ready",
+        message_func=describe_failure,
+        parse_json=True,
+    )
+    is_stopped = CustomAssertion(
+        check_func=lambda data: data["status"] == "stopped",
+        description="Status should be stopped",
+        message_func=describe_failure,
+        parse_json=True,
+    )
+
+    result = await tool_caller.call_and_assert(
+        "echo_json",
+        arguments={"data": SAMPLE_JSON},
+        assertions=[is_ready],
+    )
+    assert messages == [], "message_func should only run on failure"
+
+    outcome = is_stopped.check(result)
+    assert not outcome.passed
+    assert outcome.message == "Failed: status is ready"
+    assert messages == [SAMPLE_JSON]
+
+
+@pytest.mark.asyncio
+async def test_custom_assertion_parse_json_non_json(tool_caller):
+    """Test that parse_json fails on non-JSON content without calling the callables."""
+    called = []
+    assertion = CustomAssertion(
+        check_func=lambda data: called.append("check") or True,
+        description="Never evaluated",
+        message_func=lambda data: called.append("message") or "",
+        parse_json=True,
+    )
+
+    result = await tool_caller.call("echo", {"message": "not json"})
+    outcome = assertion.check(result)
+
+    assert not outcome.passed
+    assert outcome.message.startswith("Result should be valid JSON")
+    assert outcome.actual == "Echo: not json"
+    assert called == []
+
+
 # =============================================================================
 # Multiple Assertions Tests
 # =============================================================================
@@ -14,6 +14,9 @@ from mcp_pytest.assertions.tool_result import (
     ErrorAssertion,
     ResultContainsAssertion,
     ResultMatchesAssertion,
+    JsonFieldEqualsAssertion,
+    JsonFieldContainsAssertion,
+    JsonFieldsPresentAssertion,
     DurationAssertion,
     CustomAssertion,
 )
@@ -36,6 +39,9 @@ __all__ = [
     "ErrorAssertion",
     "ResultContainsAssertion",
     "ResultMatchesAssertion",
+    "JsonFieldEqualsAssertion",
+    "JsonFieldContainsAssertion",
+    "JsonFieldsPresentAssertion",
     "DurationAssertion",
     "CustomAssertion",
 ]
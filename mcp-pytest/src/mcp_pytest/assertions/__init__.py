@@ -6,6 +6,9 @@ from mcp_pytest.assertions.tool_result import (
     ErrorAssertion,
     ResultContainsAssertion,
     ResultMatchesAssertion,
+    JsonFieldEqualsAssertion,
+    JsonFieldContainsAssertion,
+    JsonFieldsPresentAssertion,
     DurationAssertion,
     CustomAssertion,
 )
@@ -18,6 +21,9 @@ __all__ = [
     "ErrorAssertion",
     "ResultContainsAssertion",
     "ResultMatchesAssertion",
+    "JsonFieldEqualsAssertion",
+    "JsonFieldContainsAssertion",
+    "JsonFieldsPresentAssertion",
     "DurationAssertion",
     "CustomAssertion",
 ]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Any, Callable, Optional, Pattern, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Pattern, Union
 
 from mcp_pytest.assertions.base import AssertionResult, BaseAssertion
 
@@ -220,6 +220,218 @@ class ResultEqualsAssertion(BaseAssertion):
         return f"Result equals '{self._expected}'"
 
 
+# Sentinel for a field absent from a JSON result
+_MISSING = object()
+
+# Text that can hold a JSON object; anything else has no fields to read
+_JSON_OBJECT_START = re.compile(r"\s*\{")
+
+
+def _json_object(result: ToolCallResult) -> Optional[Dict[str, Any]]:
+    """
+    Decode a JSON object result.
+
+    Content that cannot be a JSON object, such as a plain-text error or an
+    array, is rejected without being decoded.
+
+    Args:
+        result: Tool call result whose text content is JSON.
+
+    Returns:
+        The decoded object, or None if the result is not a JSON object.
+    """
+    if not _JSON_OBJECT_START.match(result.text_content):
+        return None
+    try:
+        data = result.json_content
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _json_field(result: ToolCallResult, field: str) -> Any:
+    """
+    Look up a top-level field in a JSON result.
+
+    Args:
+        result: Tool call result whose text content is JSON.
+        field: Name of the field to read.
+
+    Returns:
+        The field value, or _MISSING if the result is not a JSON object
+        or lacks the field.
+    """
+    data = _json_object(result)
+    if data is None:
+        return _MISSING
+    return data.get(field, _MISSING)
+
+
+class JsonFieldEqualsAssertion(BaseAssertion):
+    """
+    Assert that a top-level field of a JSON result equals a value.
+
+    Usage:
+        JsonFieldEqualsAssertion("success", True)
+        JsonFieldEqualsAssertion("status", "ready")
+    """
+
+    def __init__(self, field: str, expected: Any):
+        """
+        Initialize JSON field equals assertion.
+
+        Args:
+            field: Top-level field name in the JSON result.
+            expected: Value the field must equal.
+        """
+        self._field = field
+        self._expected = expected
+
+    def check(self, result: ToolCallResult) -> AssertionResult:
+        value = _json_field(result, self._field)
+
+        if value is _MISSING:
+            text = result.text_content
+            return AssertionResult(
+                passed=False,
+                message=f"Result should be a JSON object with field '{self._field}'",
+                expected=self._field,
+                actual=text[:200] + "..." if len(text) > 200 else text,
+            )
+
+        if value == self._expected:
+            return AssertionResult(
+                passed=True,
+                message=f"Field '{self._field}' equals {self._expected!r}",
+            )
+
+        return AssertionResult(
+            passed=False,
+            message=f"Field '{self._field}' should equal {self._expected!r}",
+            expected=repr(self._expected),
+            actual=repr(value),
+        )
+
+    @property
+    def description(self) -> str:
+        return f"Field '{self._field}' equals {self._expected!r}"
+
+
+class JsonFieldContainsAssertion(BaseAssertion):
+    """
+    Assert that a top-level string field of a JSON result contains text.
+
+    Usage:
+        JsonFieldContainsAssertion("output", "Hello")
+        JsonFieldContainsAssertion("error", "not found", case_sensitive=False)
+    """
+
+    def __init__(
+        self,
+        field: str,
+        expected: str,
+        case_sensitive: bool = True,
+    ):
+        """
+        Initialize JSON field contains assertion.
+
+        Args:
+            field: Top-level field name in the JSON result.
+            expected: String that must be present in the field value.
+            case_sensitive: Whether to match case-sensitively.
+        """
+        self._field = field
+        self._expected = expected if case_sensitive else expected.lower()
+        self._case_sensitive = case_sensitive
+
+    def check(self, result: ToolCallResult) -> AssertionResult:
+        value = _json_field(result, self._field)
+
+        if not isinstance(value, str):
+            text = result.text_content
+            return AssertionResult(
+                passed=False,
+                message=f"Result should have string field '{self._field}'",
+                expected=self._field,
+                actual=text[:200] + "..." if len(text) > 200 else text,
+            )
+
+        haystack = value if self._case_sensitive else value.lower()
+        if self._expected in haystack:
+            return AssertionResult(
+                passed=True,
+                message=f"Field '{self._field}' contains '{self._expected}'",
+            )
+
+        return AssertionResult(
+            passed=False,
+            message=f"Field '{self._field}' should contain '{self._expected}'",
+            expected=self._expected,
+            actual=value[:200] + "..." if len(value) > 200 else value,
+        )
+
+    @property
+    def description(self) -> str:
+        return f"Field '{self._field}' contains '{self._expected}'"
+
+
+class JsonFieldsPresentAssertion(BaseAssertion):
+    """
+    Assert that a JSON result has the given top-level fields.
+
+    Usage:
+        JsonFieldsPresentAssertion(["status", "project_name"])
+        JsonFieldsPresentAssertion(["success", "error"], require_all=False)
+    """
+
+    def __init__(self, fields: Iterable[str], require_all: bool = True):
+        """
+        Initialize JSON fields present assertion.
+
+        Args:
+            fields: Top-level field names to look for in the JSON result.
+            require_all: Require every field if True, otherwise at least one.
+        """
+        self._fields = frozenset(fields)
+        self._require_all = require_all
+
+    def check(self, result: ToolCallResult) -> AssertionResult:
+        data = _json_object(result)
+        expected = ", ".join(sorted(self._fields))
+
+        if data is None:
+            text = result.text_content
+            return AssertionResult(
+                passed=False,
+                message="Result should be a JSON object",
+                expected=expected,
+                actual=text[:200] + "..." if len(text) > 200 else text,
+            )
+
+        if self._require_all:
+            passed = self._fields <= data.keys()
+        else:
+            passed = not self._fields.isdisjoint(data)
+
+        if passed:
+            return AssertionResult(passed=True, message=self.description)
+
+        return AssertionResult(
+            passed=False,
+            message=f"Result should have {self._quantifier} fields: {expected}",
+            expected=expected,
+            actual=", ".join(sorted(data)),
+        )
+
+    @property
+    def _quantifier(self) -> str:
+        return "all of" if self._require_all else "any of"
+
+    @property
+    def description(self) -> str:
+        return f"Result has {self._quantifier} fields: {', '.join(sorted(self._fields))}"
+
+
 class DurationAssertion(BaseAssertion):
     """
     Assert that tool call completes within time limit.
@@ -286,29 +498,56 @@ class CustomAssertion(BaseAssertion):
             lambda r: "success" in r.text_content.lower(),
             "Result indicates success"
         )
+        CustomAssertion(
+            lambda data: data.get("success", False),
+            "Result reports success",
+            parse_json=True,
+        )
     """
 
     def __init__(
         self,
-        check_func: Callable[[ToolCallResult], bool],
+        check_func: Callable[[Any], bool],
         description: str,
-        message_func: Optional[Callable[[ToolCallResult], str]] = None,
+        message_func: Optional[Callable[[Any], str]] = None,
+        parse_json: bool = False,
     ):
         """
         Initialize custom assertion.
 
         Args:
-            check_func: Function that takes ToolCallResult and returns bool.
+            check_func: Function that returns bool. Takes the ToolCallResult,
+                or the decoded JSON content when parse_json is set.
             description: Human-readable description of what is being checked.
             message_func: Optional function to generate failure message.
+                Only called when the check fails. Takes the same argument
+                as check_func.
+            parse_json: Pass the decoded JSON content to check_func and
+                message_func instead of the ToolCallResult. The payload is
+                decoded once per result and shared with other assertions.
+                Content that is not valid JSON fails the assertion without
+                calling either function.
         """
         self._check_func = check_func
         self._description = description
         self._message_func = message_func
+        self._parse_json = parse_json
 
     def check(self, result: ToolCallResult) -> AssertionResult:
+        subject: Any = result
+        if self._parse_json:
+            try:
+                subject = result.json_content
+            except ValueError as e:
+                return AssertionResult(
+                    passed=False,
+                    message=f"Result should be valid JSON: {e}",
+                    actual=result.text_content[:200] if result.text_content else "(empty)",
+                    details=str(e),
+                )
+
         try:
-            passed = self._check_func(result)
+            passed = self._check_func(subject)
         except Exception as e:
             return AssertionResult(
                 passed=False,
@@ -325,7 +564,7 @@ class CustomAssertion(BaseAssertion):
         message = self._description
         if self._message_func:
             try:
-                message = self._message_func(result)
+                message = self._message_func(subject)
             except Exception:
                 pass  # Fall back to description
 
@@ -3,5 +3,6 @@
 from mcp_pytest.client.session import MCPClientSession
 from mcp_pytest.client.manager import MCPServerManager
 from mcp_pytest.client.tool_caller import ToolCaller, ToolCallResult
+from mcp_pytest.client.tools_cache import ToolsCache
 
-__all__ = ["MCPClientSession", "MCPServerManager", "ToolCaller", "ToolCallResult"]
+__all__ = ["MCPClientSession", "MCPServerManager", "ToolCaller", "ToolCallResult", "ToolsCache"]
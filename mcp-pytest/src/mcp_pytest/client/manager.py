@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional
 from mcp_pytest.client.session import MCPClientSession
 
 if TYPE_CHECKING:
+    from mcp_pytest.client.tools_cache import ToolsCache
     from mcp_pytest.config.models import MCPTestConfig
     from mcp_pytest.logging.mcp_logger import MCPLogger
 
@@ -27,6 +28,7 @@ class MCPServerManager:
         self,
         config: MCPTestConfig,
         mcp_logger: Optional[MCPLogger] = None,
+        tools_cache: Optional[ToolsCache] = None,
     ):
         """
         Initialize server manager.
@@ -34,9 +36,11 @@ class MCPServerManager:
         Args:
             config: MCP test configuration with server definitions.
             mcp_logger: Optional logger for MCP communications.
+            tools_cache: Optional persistent cache for tools/list results.
         """
         self._config = config
         self._mcp_logger = mcp_logger
+        self._tools_cache = tools_cache
         self._sessions: Dict[str, MCPClientSession] = {}
         self._locks: Dict[str, asyncio.Lock] = {}
 
@@ -84,7 +88,7 @@ class MCPServerManager:
                 )
 
             # Create and connect session
-            session = MCPClientSession(server_config, self._mcp_logger)
+            session = MCPClientSession(server_config, self._mcp_logger, self._tools_cache)
             await session.connect()
 
             self._sessions[server_name] = session
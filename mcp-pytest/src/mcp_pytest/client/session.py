@@ -13,6 +13,7 @@ from mcp.client.stdio import stdio_client
 from mcp.types import CallToolResult, Tool
 
 if TYPE_CHECKING:
+    from mcp_pytest.client.tools_cache import ToolsCache
     from mcp_pytest.config.models import ServerConfig
     from mcp_pytest.logging.mcp_logger import MCPLogger
 
@@ -28,12 +29,14 @@ class MCPClientSession:
     - Logging integration
     - Timeout handling
     - Error handling
+    - Optional tool listing cache
     """
 
     def __init__(
         self,
         server_config: ServerConfig,
         mcp_logger: Optional[MCPLogger] = None,
+        tools_cache: Optional[ToolsCache] = None,
     ):
         """
         Initialize MCP client session.
@@ -41,9 +44,12 @@ class MCPClientSession:
         Args:
             server_config: Server configuration from YAML.
             mcp_logger: Optional logger for MCP communications.
+            tools_cache: Optional persistent cache for tools/list results.
         """
         self._config = server_config
         self._mcp_logger = mcp_logger
+        self._tools_cache = tools_cache
+        self._tools: Optional[List[Tool]] = None
         self._session: Optional[ClientSession] = None
         self._exit_stack: Optional[AsyncExitStack] = None
         self._read_stream = None
@@ -150,11 +156,15 @@ class MCPClientSession:
         self._exit_stack = None
         self._read_stream = None
         self._write_stream = None
+        self._tools = None
 
     async def list_tools(self) -> List[Tool]:
         """
         Get available tools from server.
 
+        When a tools cache is configured, the listing is fetched at most once
+        per connection and reused from the cache across pytest runs.
+
         Returns:
             List of available tools.
 
@@ -163,14 +173,29 @@ class MCPClientSession:
         """
         self._ensure_connected()
 
+        if self._tools_cache is None:
+            return await self._fetch_tools()
+
+        if self._tools is None:
+            self._tools = self._tools_cache.get(self._config)
+
+        if self._tools is None:
+            self._tools = await self._fetch_tools()
+            self._tools_cache.set(self._config, self._tools)
+
+        return list(self._tools)
+
+    async def _fetch_tools(self) -> List[Tool]:
+        """Request the tool listing from the server."""
+        request_id = None
         if self._mcp_logger:
-            self._mcp_logger.log_request(self.name, "tools/list", {})
+            request_id = self._mcp_logger.log_request(self.name, "tools/list", {})
 
         result = await self._session.list_tools()  # type: ignore
 
         if self._mcp_logger:
             self._mcp_logger.log_response(
-                self.name, "tools/list", {"tool_count": len(result.tools)}
+                self.name, "tools/list", {"tool_count": len(result.tools)}, request_id
             )
 
         return result.tools
@@ -203,8 +228,10 @@ class MCPClientSession:
 
         effective_timeout = timeout if timeout is not None else self._config.startup_timeout
 
+        # Correlates the response with this request when calls overlap
+        request_id = None
         if self._mcp_logger:
-            self._mcp_logger.log_request(self.name, f"tools/call/{name}", arguments)
+            request_id = self._mcp_logger.log_request(self.name, f"tools/call/{name}", arguments)
 
         try:
             async with asyncio.timeout(effective_timeout):
@@ -218,6 +245,7 @@ class MCPClientSession:
                         "is_error": result.isError if hasattr(result, "isError") else False,
                         "content_count": len(result.content) if result.content else 0,
                     },
+                    request_id,
                 )
 
             return result
@@ -225,7 +253,10 @@ class MCPClientSession:
         except asyncio.TimeoutError:
             if self._mcp_logger:
                 self._mcp_logger.log_error(
-                    self.name, f"tools/call/{name}", f"Timeout after {effective_timeout}s"
+                    self.name,
+                    f"tools/call/{name}",
+                    f"Timeout after {effective_timeout}s",
+                    request_id,
                 )
             raise TimeoutError(f"Tool call '{name}' timed out after {effective_timeout}s")
 
@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import time
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from mcp.types import CallToolResult, TextContent
 
+_json_loads: Callable[[str], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
+# Marks json_content as not yet decoded; None is a valid JSON payload
+_UNSET = object()
+
 if TYPE_CHECKING:
     from mcp_pytest.assertions.base import BaseAssertion
     from mcp_pytest.cleanup.tracker import FileTracker
@@ -16,7 +27,13 @@ if TYPE_CHECKING:
 
 @dataclass
 class ToolCallResult:
-    """Enhanced tool call result with metadata."""
+    """
+    Enhanced tool call result with metadata.
+
+    Text and JSON content are decoded on first access, so a call whose
+    body is never inspected (e.g. fire-and-forget calls checked only
+    through call history) pays no decoding cost.
+    """
 
     name: str
     arguments: Dict[str, Any]
@@ -25,6 +42,8 @@ class ToolCallResult:
     success: bool
     error_message: Optional[str] = None
     _text_content: Optional[str] = field(default=None, repr=False)
+    _json_content: Any = field(default=_UNSET, repr=False)
+    _json_error: Optional[Tuple[str, int]] = field(default=None, repr=False)
 
     @property
     def text_content(self) -> str:
@@ -50,6 +69,34 @@ class ToolCallResult:
         self._text_content = "\n".join(texts)
         return self._text_content
 
+    @property
+    def json_content(self) -> Any:
+        """
+        Get text content parsed as JSON.
+
+        The parsed value is cached, so repeated assertions on the same
+        result only decode it once. A decode failure is cached as well, so
+        non-JSON content is not re-parsed by every assertion that reads it;
+        only its message and position are kept, and each access raises a
+        fresh error. Uses orjson when it is installed.
+
+        Returns:
+            Decoded JSON value.
+
+        Raises:
+            json.JSONDecodeError: If the text content is not valid JSON.
+        """
+        if self._json_content is _UNSET:
+            if self._json_error is not None:
+                msg, pos = self._json_error
+                raise json.JSONDecodeError(msg, self.text_content, pos)
+            try:
+                self._json_content = _json_loads(self.text_content)
+            except json.JSONDecodeError as e:
+                self._json_error = (e.msg, e.pos)
+                raise
+        return self._json_content
+
     @property
     def is_error(self) -> bool:
         """Check if result is an error."""
@@ -90,6 +137,7 @@ class ToolCaller:
         self._default_timeout = default_timeout
         self._file_tracker = file_tracker
         self._call_history: List[ToolCallResult] = []
+        self._calls_by_tool: Dict[str, List[ToolCallResult]] = {}
 
     @property
     def session(self) -> MCPClientSession:
@@ -168,8 +216,46 @@ class ToolCaller:
         )
 
         self._call_history.append(call_result)
+        self._calls_by_tool.setdefault(tool_name, []).append(call_result)
         return call_result
 
+    async def call_many(
+        self,
+        calls: List[Tuple[str, Optional[Dict[str, Any]]]],
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[ToolCallResult]:
+        """
+        Call several tools concurrently.
+
+        All requests are in flight at once, so the total time is close to the
+        slowest call instead of the sum of all calls. Only use this for calls
+        that do not depend on each other.
+
+        Args:
+            calls: List of (tool_name, arguments) pairs.
+            timeout: Optional timeout in seconds for each call.
+            max_concurrency: Optional limit on the number of calls in flight.
+
+        Returns:
+            ToolCallResults in the same order as calls. Call history records
+            them in completion order.
+        """
+        if max_concurrency is None:
+            return list(
+                await asyncio.gather(
+                    *(self.call(name, arguments, timeout) for name, arguments in calls)
+                )
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def limited(name: str, arguments: Optional[Dict[str, Any]]) -> ToolCallResult:
+            async with semaphore:
+                return await self.call(name, arguments, timeout)
+
+        return list(await asyncio.gather(*(limited(name, args) for name, args in calls)))
+
     async def call_and_assert(
         self,
         tool_name: str,
@@ -243,8 +329,6 @@ class ToolCaller:
         Returns:
             True if condition was met, False if timed out.
         """
-        import asyncio
-
         start_time = time.perf_counter()
 
         while (time.perf_counter() - start_time) < timeout:
@@ -261,6 +345,7 @@ class ToolCaller:
     def clear_history(self) -> None:
         """Clear call history."""
         self._call_history.clear()
+        self._calls_by_tool.clear()
 
     def get_last_call(self) -> Optional[ToolCallResult]:
         """Get the most recent tool call result."""
@@ -268,7 +353,12 @@ class ToolCaller:
 
     def get_calls_for_tool(self, tool_name: str) -> List[ToolCallResult]:
         """Get all calls for a specific tool."""
-        return [c for c in self._call_history if c.name == tool_name]
+        return list(self._calls_by_tool.get(tool_name, ()))
+
+    def get_last_call_for_tool(self, tool_name: str) -> Optional[ToolCallResult]:
+        """Get the most recent call result for a specific tool."""
+        calls = self._calls_by_tool.get(tool_name)
+        return calls[-1] if calls else None
 
     @staticmethod
     def _extract_error_message(result: CallToolResult) -> str:
@@ -0,0 +1,111 @@
+"""Persistent cache for MCP server tool listings."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from mcp.types import Tool
+from pydantic import ValidationError
+
+if TYPE_CHECKING:
+    from _pytest.cacheprovider import Cache
+
+    from mcp_pytest.config.models import ServerConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ToolsCache:
+    """
+    Cache tools/list results across pytest runs.
+
+    Tool listings are stored in pytest's cache directory, keyed by a hash of
+    the server's launch command, so repeated runs against the same server
+    skip the tools/list round-trip.
+
+    Usage:
+        cache = ToolsCache(request.config.cache)
+        tools = cache.get(server_config)
+        if tools is None:
+            tools = await session.list_tools()
+            cache.set(server_config, tools)
+    """
+
+    # Bump when the stored format changes to invalidate old entries
+    VERSION = 1
+
+    KEY_PREFIX = "mcp_tools"
+
+    def __init__(self, cache: Cache, refresh: bool = False):
+        """
+        Initialize tools cache.
+
+        Args:
+            cache: pytest cache object (request.config.cache).
+            refresh: If True, ignore stored entries but keep writing new ones.
+        """
+        self._cache = cache
+        self._refresh = refresh
+
+    @classmethod
+    def key_for(cls, server_config: ServerConfig) -> str:
+        """
+        Build the cache key for a server.
+
+        Args:
+            server_config: Server configuration to derive the key from.
+
+        Returns:
+            Cache key of the form "mcp_tools/<sha256>".
+        """
+        params = {
+            "command": server_config.command,
+            "args": server_config.args,
+            "env": server_config.env,
+            "cwd": str(server_config.cwd) if server_config.cwd else None,
+        }
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+        return f"{cls.KEY_PREFIX}/{digest}"
+
+    def get(self, server_config: ServerConfig) -> Optional[List[Tool]]:
+        """
+        Get cached tools for a server.
+
+        Args:
+            server_config: Server configuration to look up.
+
+        Returns:
+            List of cached tools, or None on a miss or refresh.
+        """
+        if self._refresh:
+            return None
+
+        entry: Any = self._cache.get(self.key_for(server_config), None)
+        if not isinstance(entry, dict) or entry.get("version") != self.VERSION:
+            return None
+
+        try:
+            tools = [Tool.model_validate(t) for t in entry.get("tools", [])]
+        except (ValidationError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable tools cache for '{server_config.name}': {e}")
+            return None
+
+        logger.debug(f"Loaded {len(tools)} cached tool(s) for '{server_config.name}'")
+        return tools
+
+    def set(self, server_config: ServerConfig, tools: List[Tool]) -> None:
+        """
+        Store tools for a server.
+
+        Args:
+            server_config: Server configuration the tools belong to.
+            tools: Tools returned by tools/list.
+        """
+        entry = {
+            "version": self.VERSION,
+            "tools": [t.model_dump(mode="json", exclude_none=True) for t in tools],
+        }
+        self._cache.set(self.key_for(server_config), entry)
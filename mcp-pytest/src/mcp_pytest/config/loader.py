@@ -105,6 +105,8 @@ class ConfigLoader:
         """
         logger.info(f"Loading MCP configuration from: {path}")
 
+        # Config files are a few KB at most; a plain blocking read is cheaper
+        # than dispatching to a thread executor, so keep this synchronous.
         with open(path, "r", encoding="utf-8") as f:
             data = yaml.safe_load(f)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import sys
@@ -154,6 +155,7 @@ class MCPLogger:
         self._logger.setLevel(getattr(logging, level.upper()))
         self._messages: List[MCPMessage] = []
         self._request_times: Dict[str, datetime] = {}
+        self._request_ids = itertools.count(1)
 
         # Prevent duplicate handlers
         self._logger.handlers.clear()
@@ -188,7 +190,9 @@ class MCPLogger:
             Request ID for correlation with response.
         """
         timestamp = datetime.now()
-        request_id = f"{server_name}:{method}:{timestamp.timestamp()}"
+        # A counter rather than the timestamp keeps IDs unique for requests
+        # issued concurrently within the same clock tick
+        request_id = f"{server_name}:{method}:{next(self._request_ids)}"
 
         self._request_times[request_id] = timestamp
 
@@ -245,6 +249,7 @@ class MCPLogger:
         server_name: str,
         method: str,
         error: str,
+        request_id: Optional[str] = None,
     ) -> None:
         """
         Log an MCP error.
@@ -253,13 +258,22 @@ class MCPLogger:
             server_name: Name of the server.
             method: MCP method that failed.
             error: Error message.
+            request_id: Optional request ID for duration calculation.
         """
+        timestamp = datetime.now()
+        duration_ms = None
+
+        if request_id and request_id in self._request_times:
+            start_time = self._request_times.pop(request_id)
+            duration_ms = (timestamp - start_time).total_seconds() * 1000
+
         message = MCPMessage(
-            timestamp=datetime.now(),
+            timestamp=timestamp,
             direction=MessageDirection.ERROR,
             server_name=server_name,
             method=method,
             error=error,
+            duration_ms=duration_ms,
         )
 
         self._messages.append(message)
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, AsyncGenerator, Generator, Optional
+from typing import TYPE_CHECKING, AsyncGenerator, Generator, Literal, Optional, cast
 
 import pytest
 
@@ -17,6 +17,7 @@ from mcp_pytest.cleanup.tracker import FileTracker
 from mcp_pytest.client.manager import MCPServerManager
 from mcp_pytest.client.session import MCPClientSession
 from mcp_pytest.client.tool_caller import ToolCaller
+from mcp_pytest.client.tools_cache import ToolsCache
 from mcp_pytest.config.loader import ConfigLoader
 from mcp_pytest.config.models import MCPTestConfig
 from mcp_pytest.logging.mcp_logger import MCPLogger
@@ -27,6 +28,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Scopes accepted by the mcp_server_scope ini option
+_ServerScope = Literal["module", "package", "session"]
+_SERVER_SCOPES = ("module", "package", "session")
+
 
 # =============================================================================
 # Pytest Hooks - Configuration and Options
@@ -66,6 +71,13 @@ def pytest_addoption(parser: Parser) -> None:
         help="Path to write MCP communication logs",
     )
 
+    group.addoption(
+        "--mcp-refresh-tools",
+        action="store_true",
+        dest="mcp_refresh_tools",
+        help="Ignore cached tool listings and fetch them from the servers again",
+    )
+
     # INI options
     parser.addini(
         "mcp_config_file",
@@ -86,9 +98,28 @@ def pytest_addoption(parser: Parser) -> None:
         default=True,
     )
 
+    parser.addini(
+        "mcp_cache_tools",
+        help="Cache tools/list results in .pytest_cache across runs",
+        type="bool",
+        default=False,
+    )
+
+    parser.addini(
+        "mcp_server_scope",
+        help="Fixture scope of the server connections: module (default), package or session",
+        default="module",
+    )
+
 
 def pytest_configure(config: Config) -> None:
     """Configure the MCP pytest plugin."""
+    server_scope = config.getini("mcp_server_scope")
+    if server_scope not in _SERVER_SCOPES:
+        raise pytest.UsageError(
+            f"mcp_server_scope must be one of {', '.join(_SERVER_SCOPES)}, got '{server_scope}'"
+        )
+
     # Register markers
     config.addinivalue_line(
         "markers",
@@ -108,6 +139,23 @@ def pytest_configure(config: Config) -> None:
     )
 
 
+def mcp_server_scope(fixture_name: str, config: Config) -> _ServerScope:
+    """
+    Dynamic fixture scope for fixtures that hold server connections.
+
+    Reads the mcp_server_scope ini option. Project conftests can pass this
+    as the scope of their own fixtures built on mcp_client.
+
+    Args:
+        fixture_name: Name of the fixture being scoped.
+        config: pytest config object.
+
+    Returns:
+        The configured scope name, already validated by pytest_configure.
+    """
+    return cast(_ServerScope, config.getini("mcp_server_scope"))
+
+
 # =============================================================================
 # Session-scoped Fixtures
 # =============================================================================
@@ -208,21 +256,34 @@ def file_cleaner(file_tracker: FileTracker) -> FileCleaner:
     return FileCleaner(file_tracker)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=mcp_server_scope)
 async def mcp_server_manager(
     mcp_config: MCPTestConfig,
     mcp_logger: MCPLogger,
+    request: pytest.FixtureRequest,
 ) -> AsyncGenerator[MCPServerManager, None]:
     """
-    Module-scoped MCP server manager.
+    MCP server manager, module-scoped unless mcp_server_scope says otherwise.
 
-    Starts all configured servers and keeps them running for the module.
-    Servers are automatically stopped when the module completes.
+    Starts all configured servers and keeps them running for the module
+    (or package/session). Servers are automatically stopped when that
+    scope completes.
+
+    If the mcp_cache_tools ini option is enabled, tool listings are cached
+    in pytest's cache directory (use --mcp-refresh-tools to refetch).
 
     Returns:
         MCPServerManager with all servers started.
     """
-    manager = MCPServerManager(mcp_config, mcp_logger)
+    tools_cache = None
+    pytest_cache = getattr(request.config, "cache", None)
+    if request.config.getini("mcp_cache_tools") and pytest_cache is not None:
+        tools_cache = ToolsCache(
+            pytest_cache,
+            refresh=request.config.getoption("mcp_refresh_tools"),
+        )
+
+    manager = MCPServerManager(mcp_config, mcp_logger, tools_cache)
 
     if mcp_config.servers:
         await manager.start_all_servers(parallel=mcp_config.parallel_servers)
@@ -234,13 +295,13 @@ async def mcp_server_manager(
     logger.info("Stopped all MCP servers")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=mcp_server_scope)
 async def mcp_client(
     mcp_server_manager: MCPServerManager,
     mcp_config: MCPTestConfig,
 ) -> MCPClientSession:
     """
-    Module-scoped MCP client session.
+    MCP client session, scoped like mcp_server_manager.
 
     Returns the first configured server's session by default.
     Use @pytest.mark.mcp_server("name") to specify a different server.
@@ -282,6 +343,10 @@ async def tool_caller(
     - File tracking for cleanup
     - Call history tracking
 
+    The caller is a thin per-test wrapper around the shared mcp_client
+    connection (see mcp_server_scope), so each test starts with an empty
+    call history without reconnecting to the server.
+
     After the test, tracked files are automatically cleaned up unless
     --mcp-no-cleanup is specified or @pytest.mark.mcp_skip_cleanup is used.
 
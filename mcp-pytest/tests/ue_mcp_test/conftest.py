@@ -5,20 +5,25 @@ Provides fixtures and utilities for testing Unreal Engine MCP server.
 
 CRITICAL: Event Loop Configuration
 ==================================
-MCP servers require module-scoped event loops to work correctly with pytest-asyncio.
-See pytest.ini for asyncio_default_fixture_loop_scope and asyncio_default_test_loop_scope settings.
+The MCP server connection is shared by the whole session (mcp_server_scope in
+pytest.ini), so pytest-asyncio must run fixtures and tests on a session-scoped
+event loop. See pytest.ini for asyncio_default_fixture_loop_scope and
+asyncio_default_test_loop_scope settings.
 """
 
 from __future__ import annotations
 
-import asyncio
 import json
+import os
 import tempfile
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any
 
 import pytest
 
+from mcp_pytest import ToolCaller
+from mcp_pytest.plugin import mcp_server_scope
+
 
 # =============================================================================
 # Path Fixtures
@@ -49,6 +54,31 @@ def sample_uproject_path(empty_project_path: Path) -> Path:
     return empty_project_path / "EmptyProjectTemplate.uproject"
 
 
+# =============================================================================
+# Tool Catalog Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope=mcp_server_scope)
+async def tools_index(mcp_client) -> dict[str, Any]:
+    """Tool definitions keyed by name.
+
+    The tool catalog is static for a server, so it is listed once per
+    connection and shared by all schema tests.
+    """
+    tools = await mcp_client.list_tools()
+    return {t.name: t for t in tools}
+
+
+@pytest.fixture(scope=mcp_server_scope, autouse=True)
+def _warmup(tools_index):
+    """Fetch the tool catalog before the first test that uses the server.
+
+    Server startup and the first request are paid here rather than being
+    attributed to whichever test happens to run first.
+    """
+
+
 # =============================================================================
 # Temporary Directory Fixtures
 # =============================================================================
@@ -61,14 +91,6 @@ def temp_output_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def temp_capture_dir(temp_output_dir: Path) -> Path:
-    """Directory for capture outputs."""
-    capture_dir = temp_output_dir / "captures"
-    capture_dir.mkdir(parents=True, exist_ok=True)
-    return capture_dir
-
-
 # =============================================================================
 # MCP Tool Response Helpers
 # =============================================================================
@@ -78,7 +100,7 @@ def parse_mcp_result(result) -> dict[str, Any]:
     """Parse MCP tool result content."""
     if hasattr(result, "text_content"):
         try:
-            return json.loads(result.text_content)
+            return result.json_content
         except json.JSONDecodeError:
             return {"raw_content": result.text_content}
     return {"result": result}
@@ -144,6 +166,62 @@ def editor_stopper(tool_caller):
     return stop
 
 
+# CI can export the editor state (e.g. "ready" or "not_running") so tests are
+# sorted at collection time instead of probing the server
+EDITOR_STATUS_ENV = "UE_EDITOR_STATUS"
+
+
+def _editor_ready_from_env() -> bool | None:
+    """Editor readiness declared via UE_EDITOR_STATUS, or None if unset."""
+    status = os.environ.get(EDITOR_STATUS_ENV)
+    if not status:
+        return None
+    return status.strip().lower() == "ready"
+
+
+@pytest.fixture(scope=mcp_server_scope)
+def _editor_probe() -> dict[str, bool]:
+    """Last probed editor readiness, shared per connection.
+
+    Emptied after every drives_editor test, since those launch or stop
+    the editor and make the probed state stale.
+    """
+    return {}
+
+
+@pytest.fixture
+async def editor_ready(mcp_client, mcp_config, _editor_probe) -> bool:
+    """Whether the UE Editor is running.
+
+    UE_EDITOR_STATUS wins when set. Otherwise the server is probed once and
+    the answer reused until a drives_editor test runs.
+    """
+    declared = _editor_ready_from_env()
+    if declared is not None:
+        return declared
+    if "ready" not in _editor_probe:
+        caller = ToolCaller(mcp_client, default_timeout=mcp_config.default_timeout)
+        result = await caller.call("editor.status", arguments={})
+        _editor_probe["ready"] = parse_mcp_result(result).get("status") == "ready"
+    return _editor_probe["ready"]
+
+
+@pytest.fixture(autouse=True)
+def _skip_by_editor_state(request):
+    """Skip tests whose editor marker does not match the editor state."""
+    requires = request.node.get_closest_marker("requires_editor") is not None
+    without = request.node.get_closest_marker("without_editor") is not None
+    if requires and not request.getfixturevalue("editor_ready"):
+        pytest.skip("UE Editor is not running")
+    elif without and request.getfixturevalue("editor_ready"):
+        pytest.skip("UE Editor is running")
+
+    yield
+
+    if request.node.get_closest_marker("drives_editor") is not None:
+        request.getfixturevalue("_editor_probe").clear()
+
+
 # =============================================================================
 # Test Utilities
 # =============================================================================
@@ -167,25 +245,6 @@ def expected_tools():
     ]
 
 
-# =============================================================================
-# Event Loop Configuration
-# =============================================================================
-
-
-@pytest.fixture(scope="module")
-def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
-    """Create a module-scoped event loop.
-
-    This ensures MCP client sessions created in module-scoped fixtures
-    remain valid across all tests in the module.
-    """
-    policy = asyncio.get_event_loop_policy()
-    loop = policy.new_event_loop()
-    asyncio.set_event_loop(loop)
-    yield loop
-    loop.close()
-
-
 # =============================================================================
 # Configuration Hooks
 # =============================================================================
@@ -196,3 +255,32 @@ def pytest_configure(config):
     print("\n=== UE-MCP Tool Test Suite ===\n")
     print("Testing Unreal Engine MCP Server Tools")
     print("=" * 40)
+
+
+# Tests that drive the editor or depend on its state, so under
+# "pytest -n auto --dist loadgroup" they all run on one xdist worker
+EDITOR_XDIST_GROUP = "ue_editor"
+EDITOR_GROUP_MARKERS = ("integration", "requires_editor", "without_editor", "drives_editor")
+
+
+# xdist appends "@<group>" to node IDs in its own pytest_collection_modifyitems,
+# which is registered after this conftest, so the group must be set first
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Group editor tests for xdist and apply UE_EDITOR_STATUS skips."""
+    for item in items:
+        if any(item.get_closest_marker(name) for name in EDITOR_GROUP_MARKERS):
+            item.add_marker(pytest.mark.xdist_group(EDITOR_XDIST_GROUP))
+
+    ready = _editor_ready_from_env()
+    if ready is None:
+        return
+
+    if ready:
+        marker, reason = "without_editor", "UE Editor is running"
+    else:
+        marker, reason = "requires_editor", "UE Editor is not running"
+    skip = pytest.mark.skip(reason=f"{reason} ({EDITOR_STATUS_ENV})")
+    for item in items:
+        if item.get_closest_marker(marker) is not None:
+            item.add_marker(skip)
@@ -11,7 +11,7 @@ Run with:
     pytest test_capture_tools.py -v
 """
 
-import json
+import logging
 from pathlib import Path
 
 import pytest
@@ -19,22 +19,56 @@ import pytest
 from mcp_pytest import (
     CustomAssertion,
     DurationAssertion,
+    JsonFieldsPresentAssertion,
     SuccessAssertion,
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Level loaded by the capture tools under test
+TEST_LEVEL = "/Game/Maps/TestLevel"
+
+# Arguments shared by most orbital capture calls
+_ORBITAL_BASE = {
+    "level": TEST_LEVEL,
+    "target_x": 0.0,
+    "target_y": 0.0,
+    "target_z": 0.0,
+}
+
+
+def _orbital_args(**overrides):
+    """Build orbital capture arguments from the shared base.
+
+    Keyword arguments replace base entries; passing None drops the key.
+    """
+    args = _ORBITAL_BASE.copy()
+    args.update(overrides)
+    return {k: v for k, v in args.items() if v is not None}
+
+
+# Response checks: well-formed reply, capture succeeded, file paths returned
+_VALID_CAPTURE_RESPONSE = JsonFieldsPresentAssertion({"success", "error"}, require_all=False)
+
+_CAPTURE_SUCCEEDED = CustomAssertion(
+    check_func=lambda data: data.get("success", False),
+    description="Capture should succeed",
+    message_func=lambda data: f"Capture failed: {data.get('error', 'Unknown')}",
+    parse_json=True,
+)
+
+_FILES_CREATED = JsonFieldsPresentAssertion({"files"})
+
+
 # =============================================================================
 # Capture Tool Discovery Tests
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_capture_tools_exist(mcp_client):
+async def test_capture_tools_exist(tools_index):
     """Test that all capture tools exist."""
-    tools = await mcp_client.list_tools()
-    tool_names = [t.name for t in tools]
-
     capture_tools = [
         "editor.capture.orbital",
         "editor.capture.pie",
@@ -42,11 +76,11 @@ async def test_capture_tools_exist(mcp_client):
     ]
 
     for tool_name in capture_tools:
-        assert tool_name in tool_names, f"Missing capture tool: {tool_name}"
+        assert tool_name in tools_index, f"Missing capture tool: {tool_name}"
 
-    print("All capture tools found:")
+    logger.debug("All capture tools found:")
     for tool_name in capture_tools:
-        print(f"  - {tool_name}")
+        logger.debug("  - %s", tool_name)
 
 
 # =============================================================================
@@ -54,12 +88,10 @@ async def test_capture_tools_exist(mcp_client):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_orbital_tool_schema(tool_caller):
+async def test_orbital_tool_schema(tools_index):
     """Test editor.capture.orbital tool schema and parameters."""
-    tools = await tool_caller.client.list_tools()
-    orbital_tool = next((t for t in tools if t.name == "editor.capture.orbital"), None)
+    orbital_tool = tools_index.get("editor.capture.orbital")
 
     assert orbital_tool is not None
     assert orbital_tool.description
@@ -76,43 +108,41 @@ async def test_orbital_tool_schema(tool_caller):
         "resolution_width", "resolution_height",
     ]
 
-    print("editor.capture.orbital schema:")
-    print(f"  Description: {orbital_tool.description[:150]}...")
-    print(f"  Parameters:")
+    logger.debug("editor.capture.orbital schema:")
+    logger.debug("  Description: %s...", orbital_tool.description[:150])
+    logger.debug("  Parameters:")
     for param in expected_params:
         if param in props:
             prop_info = props[param]
-            print(f"    {param}: {prop_info.get('type', 'unknown')}")
+            logger.debug("    %s: %s", param, prop_info.get("type", "unknown"))
         else:
-            print(f"    {param}: NOT FOUND")
+            logger.debug("    %s: NOT FOUND", param)
 
     # Required params
-    print(f"  Required: {required}")
+    logger.debug("  Required: %s", required)
 
     # Level should be required
     assert "level" in required, "'level' should be required"
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_orbital_preset_values(tool_caller):
+async def test_orbital_preset_values(tools_index):
     """Test orbital preset parameter values."""
-    tools = await tool_caller.client.list_tools()
-    orbital_tool = next((t for t in tools if t.name == "editor.capture.orbital"), None)
+    orbital_tool = tools_index.get("editor.capture.orbital")
 
     props = orbital_tool.inputSchema.get("properties", {})
     preset_prop = props.get("preset", {})
 
-    print(f"Preset property: {preset_prop}")
+    logger.debug("Preset property: %s", preset_prop)
 
     # Valid presets from server.py
     valid_presets = [
         "all", "perspective", "orthographic",
         "birdseye", "horizontal", "technical",
     ]
-    print("Valid presets:")
+    logger.debug("Valid presets:")
     for preset in valid_presets:
-        print(f"  - {preset}")
+        logger.debug("  - %s", preset)
 
 
 # =============================================================================
@@ -120,12 +150,10 @@ async def test_orbital_preset_values(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_pie_tool_schema(tool_caller):
+async def test_pie_tool_schema(tools_index):
     """Test editor.capture.pie tool schema and parameters."""
-    tools = await tool_caller.client.list_tools()
-    pie_tool = next((t for t in tools if t.name == "editor.capture.pie"), None)
+    pie_tool = tools_index.get("editor.capture.pie")
 
     assert pie_tool is not None
     assert pie_tool.description
@@ -141,16 +169,21 @@ async def test_pie_tool_schema(tool_caller):
         "multi_angle", "camera_distance", "target_height",
     ]
 
-    print("editor.capture.pie schema:")
-    print(f"  Description: {pie_tool.description[:150]}...")
-    print(f"  Parameters:")
+    logger.debug("editor.capture.pie schema:")
+    logger.debug("  Description: %s...", pie_tool.description[:150])
+    logger.debug("  Parameters:")
     for param in expected_params:
         if param in props:
             prop_info = props[param]
             default = prop_info.get("default", "none")
-            print(f"    {param}: {prop_info.get('type', 'unknown')} (default: {default})")
+            logger.debug(
+                "    %s: %s (default: %s)",
+                param,
+                prop_info.get("type", "unknown"),
+                default,
+            )
 
-    print(f"  Required: {required}")
+    logger.debug("  Required: %s", required)
 
 
 # =============================================================================
@@ -158,12 +191,10 @@ async def test_pie_tool_schema(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_window_tool_schema(tool_caller):
+async def test_window_tool_schema(tools_index):
     """Test editor.capture.window tool schema and parameters."""
-    tools = await tool_caller.client.list_tools()
-    window_tool = next((t for t in tools if t.name == "editor.capture.window"), None)
+    window_tool = tools_index.get("editor.capture.window")
 
     assert window_tool is not None
     assert window_tool.description
@@ -178,34 +209,32 @@ async def test_window_tool_schema(tool_caller):
         "asset_path", "asset_list", "output_dir", "tab",
     ]
 
-    print("editor.capture.window schema:")
-    print(f"  Description: {window_tool.description[:150]}...")
-    print(f"  Parameters:")
+    logger.debug("editor.capture.window schema:")
+    logger.debug("  Description: %s...", window_tool.description[:150])
+    logger.debug("  Parameters:")
     for param in expected_params:
         if param in props:
             prop_info = props[param]
-            print(f"    {param}: {prop_info.get('type', 'unknown')}")
+            logger.debug("    %s: %s", param, prop_info.get("type", "unknown"))
 
-    print(f"  Required: {required}")
+    logger.debug("  Required: %s", required)
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_window_mode_values(tool_caller):
+async def test_window_mode_values(tools_index):
     """Test window capture mode parameter values."""
-    tools = await tool_caller.client.list_tools()
-    window_tool = next((t for t in tools if t.name == "editor.capture.window"), None)
+    window_tool = tools_index.get("editor.capture.window")
 
     props = window_tool.inputSchema.get("properties", {})
     mode_prop = props.get("mode", {})
 
-    print(f"Mode property: {mode_prop}")
+    logger.debug("Mode property: %s", mode_prop)
 
     # Valid modes from server.py
     valid_modes = ["window", "asset", "batch"]
-    print("Valid modes:")
+    logger.debug("Valid modes:")
     for mode in valid_modes:
-        print(f"  - {mode}")
+        logger.debug("  - %s", mode)
 
 
 # =============================================================================
@@ -213,104 +242,87 @@ async def test_window_mode_values(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_orbital_missing_level(tool_caller):
     """Test orbital capture with missing level parameter."""
     result = await tool_caller.call(
         "editor.capture.orbital",
-        arguments={
-            "target_x": 0,
-            "target_y": 0,
-            "target_z": 0,
-            # Missing required 'level'
-        },
+        arguments=_orbital_args(level=None),
         expect_error=True,
     )
 
-    print(f"Missing level error: {result.error_message or result.text_content}")
+    logger.debug("Missing level error: %s", result.error_message or result.text_content)
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
-async def test_orbital_basic_capture(tool_caller, temp_capture_dir):
+async def test_orbital_basic_capture(tool_caller, tmp_path):
     """Test basic orbital capture."""
     result = await tool_caller.call(
         "editor.capture.orbital",
-        arguments={
-            "level": "/Game/Maps/TestLevel",
-            "target_x": 0.0,
-            "target_y": 0.0,
-            "target_z": 100.0,
-            "distance": 500.0,
-            "preset": "orthographic",
-            "output_dir": str(temp_capture_dir),
-            "resolution_width": 800,
-            "resolution_height": 600,
-        },
+        arguments=_orbital_args(
+            target_z=100.0,
+            distance=500.0,
+            preset="orthographic",
+            output_dir=str(tmp_path),
+            resolution_width=800,
+            resolution_height=600,
+        ),
     )
 
-    capture_data = json.loads(result.text_content)
-    print(f"Orbital capture result: {json.dumps(capture_data, indent=2)}")
+    capture_data = result.json_content
+    logger.debug("Orbital capture result: %s", capture_data)
 
     if capture_data.get("success"):
         assert "files" in capture_data, "Should contain file paths"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
-async def test_orbital_all_presets(tool_caller, temp_capture_dir):
-    """Test orbital capture with different presets."""
-    presets = ["orthographic", "perspective", "birdseye", "horizontal", "all"]
-
-    for preset in presets:
-        result = await tool_caller.call(
-            "editor.capture.orbital",
-            arguments={
-                "level": "/Game/Maps/TestLevel",
-                "target_x": 0.0,
-                "target_y": 0.0,
-                "target_z": 100.0,
-                "distance": 500.0,
-                "preset": preset,
-                "output_dir": str(temp_capture_dir / preset),
-            },
-        )
-
-        capture_data = json.loads(result.text_content)
-        print(f"Preset '{preset}': success={capture_data.get('success')}")
-
-
-@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "preset", ["orthographic", "perspective", "birdseye", "horizontal", "all"]
+)
+async def test_orbital_preset(tool_caller, tmp_path, preset):
+    """Test orbital capture with each preset."""
+    result = await tool_caller.call(
+        "editor.capture.orbital",
+        arguments=_orbital_args(
+            target_z=100.0,
+            distance=500.0,
+            preset=preset,
+            output_dir=str(tmp_path / preset),
+        ),
+    )
+
+    capture_data = result.json_content
+    logger.info("Preset '%s': success=%s", preset, capture_data.get("success"))
+
+
 @pytest.mark.integration
 @pytest.mark.requires_editor
-async def test_orbital_custom_resolution(tool_caller, temp_capture_dir):
-    """Test orbital capture with custom resolution."""
-    resolutions = [
+@pytest.mark.parametrize(
+    "width,height",
+    [
         (1920, 1080),  # Full HD
         (1280, 720),   # HD
         (640, 480),    # VGA
-    ]
+    ],
+)
+async def test_orbital_custom_resolution(tool_caller, tmp_path, width, height):
+    """Test orbital capture with custom resolution."""
+    result = await tool_caller.call(
+        "editor.capture.orbital",
+        arguments=_orbital_args(
+            target_z=100.0,
+            distance=500.0,
+            preset="perspective",
+            resolution_width=width,
+            resolution_height=height,
+        ),
+    )
 
-    for width, height in resolutions:
-        result = await tool_caller.call(
-            "editor.capture.orbital",
-            arguments={
-                "level": "/Game/Maps/TestLevel",
-                "target_x": 0.0,
-                "target_y": 0.0,
-                "target_z": 100.0,
-                "distance": 500.0,
-                "preset": "perspective",
-                "resolution_width": width,
-                "resolution_height": height,
-            },
-        )
-
-        capture_data = json.loads(result.text_content)
-        print(f"Resolution {width}x{height}: success={capture_data.get('success')}")
+    capture_data = result.json_content
+    logger.info("Resolution %dx%d: success=%s", width, height, capture_data.get("success"))
 
 
 # =============================================================================
@@ -318,7 +330,6 @@ async def test_orbital_custom_resolution(tool_caller, temp_capture_dir):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_pie_missing_required_params(tool_caller):
     """Test PIE capture with missing required parameters."""
@@ -331,20 +342,19 @@ async def test_pie_missing_required_params(tool_caller):
         expect_error=True,
     )
 
-    print(f"Missing params error: {result.error_message or result.text_content}")
+    logger.debug("Missing params error: %s", result.error_message or result.text_content)
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 @pytest.mark.slow
-async def test_pie_basic_capture(tool_caller, temp_capture_dir):
+async def test_pie_basic_capture(tool_caller, tmp_path):
     """Test basic PIE capture."""
     result = await tool_caller.call(
         "editor.capture.pie",
         arguments={
-            "output_dir": str(temp_capture_dir),
-            "level": "/Game/Maps/TestLevel",
+            "output_dir": str(tmp_path),
+            "level": TEST_LEVEL,
             "duration_seconds": 5.0,
             "interval_seconds": 1.0,
             "resolution_width": 1280,
@@ -353,24 +363,23 @@ async def test_pie_basic_capture(tool_caller, temp_capture_dir):
         },
     )
 
-    capture_data = json.loads(result.text_content)
-    print(f"PIE capture result: {json.dumps(capture_data, indent=2)}")
+    capture_data = result.json_content
+    logger.debug("PIE capture result: %s", capture_data)
 
     if capture_data.get("success"):
         assert "output_dir" in capture_data or "files" in capture_data
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 @pytest.mark.slow
-async def test_pie_multi_angle_capture(tool_caller, temp_capture_dir):
+async def test_pie_multi_angle_capture(tool_caller, tmp_path):
     """Test PIE capture with multi-angle enabled."""
     result = await tool_caller.call(
         "editor.capture.pie",
         arguments={
-            "output_dir": str(temp_capture_dir),
-            "level": "/Game/Maps/TestLevel",
+            "output_dir": str(tmp_path),
+            "level": TEST_LEVEL,
             "duration_seconds": 5.0,
             "interval_seconds": 1.0,
             "multi_angle": True,
@@ -379,32 +388,29 @@ async def test_pie_multi_angle_capture(tool_caller, temp_capture_dir):
         },
     )
 
-    capture_data = json.loads(result.text_content)
-    print(f"Multi-angle PIE: {json.dumps(capture_data, indent=2)}")
+    capture_data = result.json_content
+    logger.debug("Multi-angle PIE: %s", capture_data)
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 @pytest.mark.slow
-async def test_pie_different_intervals(tool_caller, temp_capture_dir):
+@pytest.mark.parametrize("interval", [0.5, 1.0, 2.0])
+async def test_pie_different_intervals(tool_caller, tmp_path, interval):
     """Test PIE capture with different capture intervals."""
-    intervals = [0.5, 1.0, 2.0]
-
-    for interval in intervals:
-        result = await tool_caller.call(
-            "editor.capture.pie",
-            arguments={
-                "output_dir": str(temp_capture_dir / f"interval_{interval}"),
-                "level": "/Game/Maps/TestLevel",
-                "duration_seconds": 3.0,
-                "interval_seconds": interval,
-                "multi_angle": False,
-            },
-        )
+    result = await tool_caller.call(
+        "editor.capture.pie",
+        arguments={
+            "output_dir": str(tmp_path / f"interval_{interval}"),
+            "level": TEST_LEVEL,
+            "duration_seconds": 3.0,
+            "interval_seconds": interval,
+            "multi_angle": False,
+        },
+    )
 
-        capture_data = json.loads(result.text_content)
-        print(f"Interval {interval}s: success={capture_data.get('success')}")
+    capture_data = result.json_content
+    logger.info("Interval %ss: success=%s", interval, capture_data.get("success"))
 
 
 # =============================================================================
@@ -412,158 +418,151 @@ async def test_pie_different_intervals(tool_caller, temp_capture_dir):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_window_mode_validation(tool_caller, temp_capture_dir):
+async def test_window_mode_validation(tool_caller, tmp_path):
     """Test window capture mode parameter validation."""
     # Window mode requires output_file
     result = await tool_caller.call(
         "editor.capture.window",
         arguments={
-            "level": "/Game/Maps/TestLevel",
+            "level": TEST_LEVEL,
             "mode": "window",
             # Missing output_file
         },
     )
 
-    capture_data = json.loads(result.text_content)
-    print(f"Window mode validation: {json.dumps(capture_data, indent=2)}")
+    capture_data = result.json_content
+    logger.debug("Window mode validation: %s", capture_data)
 
     # Should fail with error about missing output_file
     assert not capture_data.get("success") or "error" in capture_data
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_window_asset_mode_validation(tool_caller, temp_capture_dir):
+async def test_window_asset_mode_validation(tool_caller, tmp_path):
     """Test window capture asset mode validation."""
     # Asset mode requires both output_file and asset_path
     result = await tool_caller.call(
         "editor.capture.window",
         arguments={
-            "level": "/Game/Maps/TestLevel",
+            "level": TEST_LEVEL,
             "mode": "asset",
-            "output_file": str(temp_capture_dir / "asset.png"),
+            "output_file": str(tmp_path / "asset.png"),
             # Missing asset_path
         },
     )
 
-    capture_data = json.loads(result.text_content)
-    print(f"Asset mode validation: {json.dumps(capture_data, indent=2)}")
+    capture_data = result.json_content
+    logger.debug("Asset mode validation: %s", capture_data)
 
     assert not capture_data.get("success")
     assert "asset_path" in capture_data.get("error", "").lower()
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_window_batch_mode_validation(tool_caller, temp_capture_dir):
+async def test_window_batch_mode_validation(tool_caller, tmp_path):
     """Test window capture batch mode validation."""
     # Batch mode requires asset_list and output_dir
     result = await tool_caller.call(
         "editor.capture.window",
         arguments={
-            "level": "/Game/Maps/TestLevel",
+            "level": TEST_LEVEL,
             "mode": "batch",
             # Missing asset_list and output_dir
         },
     )
 
-    capture_data = json.loads(result.text_content)
-    print(f"Batch mode validation: {json.dumps(capture_data, indent=2)}")
+    capture_data = result.json_content
+    logger.debug("Batch mode validation: %s", capture_data)
 
     assert not capture_data.get("success")
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
-async def test_window_capture_main_window(tool_caller, temp_capture_dir):
+async def test_window_capture_main_window(tool_caller, tmp_path):
     """Test capturing the main editor window."""
-    output_file = temp_capture_dir / "main_window.png"
+    output_file = tmp_path / "main_window.png"
 
     result = await tool_caller.call(
         "editor.capture.window",
         arguments={
-            "level": "/Game/Maps/TestLevel",
+            "level": TEST_LEVEL,
             "mode": "window",
             "output_file": str(output_file),
         },
     )
 
-    capture_data = json.loads(result.text_content)
-    print(f"Window capture: {json.dumps(capture_data, indent=2)}")
+    capture_data = result.json_content
+    logger.debug("Window capture: %s", capture_data)
 
     if capture_data.get("success"):
         assert "file" in capture_data
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
-async def test_window_capture_asset_editor(tool_caller, temp_capture_dir):
+async def test_window_capture_asset_editor(tool_caller, tmp_path):
     """Test capturing an asset editor window."""
-    output_file = temp_capture_dir / "asset_editor.png"
+    output_file = tmp_path / "asset_editor.png"
 
     result = await tool_caller.call(
         "editor.capture.window",
         arguments={
-            "level": "/Game/Maps/TestLevel",
+            "level": TEST_LEVEL,
             "mode": "asset",
             "output_file": str(output_file),
             "asset_path": "/Game/SomeAsset",  # Would need real asset path
         },
     )
 
-    capture_data = json.loads(result.text_content)
-    print(f"Asset editor capture: {json.dumps(capture_data, indent=2)}")
+    capture_data = result.json_content
+    logger.debug("Asset editor capture: %s", capture_data)
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
-async def test_window_capture_batch(tool_caller, temp_capture_dir):
+async def test_window_capture_batch(tool_caller, tmp_path):
     """Test batch capture of multiple assets."""
     result = await tool_caller.call(
         "editor.capture.window",
         arguments={
-            "level": "/Game/Maps/TestLevel",
+            "level": TEST_LEVEL,
             "mode": "batch",
             "asset_list": [
                 "/Game/Asset1",
                 "/Game/Asset2",
                 "/Game/Asset3",
             ],
-            "output_dir": str(temp_capture_dir / "batch"),
+            "output_dir": str(tmp_path / "batch"),
         },
     )
 
-    capture_data = json.loads(result.text_content)
-    print(f"Batch capture: {json.dumps(capture_data, indent=2)}")
+    capture_data = result.json_content
+    logger.debug("Batch capture: %s", capture_data)
 
     if capture_data.get("success"):
         assert "files" in capture_data
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
-async def test_window_capture_with_tab(tool_caller, temp_capture_dir):
+async def test_window_capture_with_tab(tool_caller, tmp_path):
     """Test window capture with tab switching."""
-    output_file = temp_capture_dir / "tab_capture.png"
+    output_file = tmp_path / "tab_capture.png"
 
     result = await tool_caller.call(
         "editor.capture.window",
         arguments={
-            "level": "/Game/Maps/TestLevel",
+            "level": TEST_LEVEL,
             "mode": "window",
             "output_file": str(output_file),
             "tab": 1,  # Switch to tab 1
         },
     )
 
-    capture_data = json.loads(result.text_content)
-    print(f"Tab capture: {json.dumps(capture_data, indent=2)}")
+    capture_data = result.json_content
+    logger.debug("Tab capture: %s", capture_data)
 
 
 # =============================================================================
@@ -571,48 +570,32 @@ async def test_window_capture_with_tab(tool_caller, temp_capture_dir):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
-async def test_orbital_without_editor(tool_caller, editor_status_checker, temp_capture_dir):
+@pytest.mark.without_editor
+async def test_orbital_without_editor(tool_caller, tmp_path):
     """Test orbital capture when editor is not running."""
-    status = await editor_status_checker()
-
-    if status.get("status") not in ["ready"]:
-        result = await tool_caller.call(
-            "editor.capture.orbital",
-            arguments={
-                "level": "/Game/Maps/TestLevel",
-                "target_x": 0.0,
-                "target_y": 0.0,
-                "target_z": 0.0,
-                "output_dir": str(temp_capture_dir),
-            },
-        )
+    result = await tool_caller.call(
+        "editor.capture.orbital",
+        arguments=_orbital_args(output_dir=str(tmp_path)),
+    )
 
-        capture_data = json.loads(result.text_content)
-        print(f"Capture without editor: {json.dumps(capture_data, indent=2)}")
+    capture_data = result.json_content
+    logger.debug("Capture without editor: %s", capture_data)
 
-        # Should fail gracefully
-        assert not capture_data.get("success")
+    # Should fail gracefully
+    assert not capture_data.get("success")
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
-async def test_orbital_invalid_level(tool_caller, temp_capture_dir):
+async def test_orbital_invalid_level(tool_caller, tmp_path):
     """Test orbital capture with invalid level path."""
     result = await tool_caller.call(
         "editor.capture.orbital",
-        arguments={
-            "level": "/Game/NonExistent/Level",
-            "target_x": 0.0,
-            "target_y": 0.0,
-            "target_z": 0.0,
-            "output_dir": str(temp_capture_dir),
-        },
+        arguments=_orbital_args(level="/Game/NonExistent/Level", output_dir=str(tmp_path)),
     )
 
-    capture_data = json.loads(result.text_content)
-    print(f"Invalid level: {json.dumps(capture_data, indent=2)}")
+    capture_data = result.json_content
+    logger.debug("Invalid level: %s", capture_data)
 
 
 # =============================================================================
@@ -620,71 +603,38 @@ async def test_orbital_invalid_level(tool_caller, temp_capture_dir):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_capture_tools_response_format(tool_caller, temp_capture_dir):
+async def test_capture_tools_response_format(tool_caller, tmp_path):
     """Test that capture tools return properly formatted responses."""
-    # Custom assertion for capture response format
-    valid_capture_response = CustomAssertion(
-        check_func=lambda r: (
-            "success" in json.loads(r.text_content)
-            or "error" in json.loads(r.text_content)
-        ),
-        description="Capture response should contain 'success' or 'error'",
-    )
-
     # Test orbital
     result = await tool_caller.call_and_assert(
         "editor.capture.orbital",
-        arguments={
-            "level": "/Game/Maps/TestLevel",
-            "target_x": 0.0,
-            "target_y": 0.0,
-            "target_z": 0.0,
-            "output_dir": str(temp_capture_dir),
-        },
+        arguments=_orbital_args(output_dir=str(tmp_path)),
         assertions=[
             SuccessAssertion(),  # MCP call succeeds
-            valid_capture_response,
+            _VALID_CAPTURE_RESPONSE,
         ],
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 @pytest.mark.mcp_timeout(120)  # 2 minute timeout for captures
-async def test_orbital_capture_with_assertions(tool_caller, temp_capture_dir):
+async def test_orbital_capture_with_assertions(tool_caller, tmp_path):
     """Test orbital capture with full assertion suite."""
-    # Custom assertion for successful capture
-    capture_succeeded = CustomAssertion(
-        check_func=lambda r: json.loads(r.text_content).get("success", False),
-        description="Capture should succeed",
-        message_func=lambda r: f"Capture failed: {json.loads(r.text_content).get('error', 'Unknown')}",
-    )
-
-    # Custom assertion for files created
-    files_created = CustomAssertion(
-        check_func=lambda r: "files" in json.loads(r.text_content),
-        description="Response should contain captured file paths",
-    )
-
     result = await tool_caller.call_and_assert(
         "editor.capture.orbital",
-        arguments={
-            "level": "/Game/Maps/TestLevel",
-            "target_x": 0.0,
-            "target_y": 0.0,
-            "target_z": 100.0,
-            "distance": 500.0,
-            "preset": "perspective",
-            "output_dir": str(temp_capture_dir),
-        },
+        arguments=_orbital_args(
+            target_z=100.0,
+            distance=500.0,
+            preset="perspective",
+            output_dir=str(tmp_path),
+        ),
         assertions=[
             SuccessAssertion(),
             DurationAssertion(max_seconds=120),
-            capture_succeeded,
-            files_created,
+            _CAPTURE_SUCCEEDED,
+            _FILES_CREATED,
         ],
     )
 
@@ -694,29 +644,25 @@ async def test_orbital_capture_with_assertions(tool_caller, temp_capture_dir):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_capture_call_history(tool_caller, temp_capture_dir):
+async def test_capture_call_history(tool_caller, tmp_path):
     """Test that capture calls are tracked in history."""
-    # Make various capture calls
-    await tool_caller.call(
-        "editor.capture.orbital",
-        arguments={
-            "level": "/Game/Maps/TestLevel",
-            "target_x": 0.0,
-            "target_y": 0.0,
-            "target_z": 0.0,
-            "output_dir": str(temp_capture_dir),
-        },
-    )
-
-    await tool_caller.call(
-        "editor.capture.window",
-        arguments={
-            "level": "/Game/Maps/TestLevel",
-            "mode": "window",
-            "output_file": str(temp_capture_dir / "test.png"),
-        },
+    # Make various capture calls; they are independent, so issue them together
+    await tool_caller.call_many(
+        [
+            (
+                "editor.capture.orbital",
+                _orbital_args(output_dir=str(tmp_path)),
+            ),
+            (
+                "editor.capture.window",
+                {
+                    "level": TEST_LEVEL,
+                    "mode": "window",
+                    "output_file": str(tmp_path / "test.png"),
+                },
+            ),
+        ]
     )
 
     # Check history
@@ -726,5 +672,5 @@ async def test_capture_call_history(tool_caller, temp_capture_dir):
     assert len(orbital_calls) >= 1, "Should have orbital capture calls"
     assert len(window_calls) >= 1, "Should have window capture calls"
 
-    print(f"Orbital calls: {len(orbital_calls)}")
-    print(f"Window calls: {len(window_calls)}")
+    logger.debug("Orbital calls: %s", len(orbital_calls))
+    logger.debug("Window calls: %s", len(window_calls))
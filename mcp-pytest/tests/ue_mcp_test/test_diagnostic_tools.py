@@ -9,30 +9,57 @@ Run with:
     pytest test_diagnostic_tools.py -v
 """
 
-import json
+import logging
+import re
+from collections import Counter
 
 import pytest
 
 from mcp_pytest import (
     CustomAssertion,
     DurationAssertion,
+    JsonFieldsPresentAssertion,
     SuccessAssertion,
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Level asset used as the default diagnostic target
+TEST_LEVEL = "/Game/Maps/TestLevel"
+
+# Words the tool description is expected to mention: supported asset types
+# and fields of the returned report
+SUPPORTED_TYPES = frozenset({"level", "blueprint", "material", "staticmesh"})
+RETURN_FIELDS = frozenset({"success", "asset_type", "issues", "errors", "warnings"})
+_DESCRIPTION_TOKENS = re.compile("|".join(sorted(SUPPORTED_TYPES | RETURN_FIELDS)), re.IGNORECASE)
+
+# Response checks: well-formed reply, diagnostic succeeded, issues reported as a list
+_VALID_DIAGNOSTIC_RESPONSE = JsonFieldsPresentAssertion({"success", "error"}, require_all=False)
+
+_DIAGNOSTIC_SUCCEEDED = CustomAssertion(
+    check_func=lambda data: data.get("success", False),
+    description="Diagnostic should succeed",
+    message_func=lambda data: f"Diagnostic failed: {data.get('error', 'Unknown')}",
+    parse_json=True,
+)
+
+_HAS_ISSUES_LIST = CustomAssertion(
+    check_func=lambda data: isinstance(data.get("issues"), list),
+    description="Response should have issues list",
+    parse_json=True,
+)
+
+
 # =============================================================================
 # Tool Discovery Tests
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_diagnostic_tool_exists(mcp_client):
+async def test_diagnostic_tool_exists(tools_index):
     """Test that editor.asset.diagnostic tool exists."""
-    tools = await mcp_client.list_tools()
-    tool_names = [t.name for t in tools]
-
-    assert "editor.asset.diagnostic" in tool_names, \
+    assert "editor.asset.diagnostic" in tools_index, \
         "editor.asset.diagnostic tool should exist"
 
 
@@ -41,12 +68,10 @@ async def test_diagnostic_tool_exists(mcp_client):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_diagnostic_tool_schema(tool_caller):
+async def test_diagnostic_tool_schema(tools_index):
     """Test editor.asset.diagnostic tool schema and parameters."""
-    tools = await tool_caller.client.list_tools()
-    diagnostic_tool = next((t for t in tools if t.name == "editor.asset.diagnostic"), None)
+    diagnostic_tool = tools_index.get("editor.asset.diagnostic")
 
     assert diagnostic_tool is not None
     assert diagnostic_tool.description
@@ -56,36 +81,31 @@ async def test_diagnostic_tool_schema(tool_caller):
     props = schema.get("properties", {})
     required = schema.get("required", [])
 
-    print("editor.asset.diagnostic schema:")
-    print(f"  Description: {diagnostic_tool.description[:200]}...")
-    print(f"  Parameters: {list(props.keys())}")
-    print(f"  Required: {required}")
+    logger.debug("editor.asset.diagnostic schema:")
+    logger.debug("  Description: %s...", diagnostic_tool.description[:200])
+    logger.debug("  Parameters: %s", list(props.keys()))
+    logger.debug("  Required: %s", required)
 
     # asset_path should be required
     assert "asset_path" in props, "Should have 'asset_path' parameter"
     assert "asset_path" in required, "'asset_path' should be required"
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_diagnostic_tool_description(tool_caller):
+async def test_diagnostic_tool_description(tools_index):
     """Test that diagnostic tool has informative description."""
-    tools = await tool_caller.client.list_tools()
-    diagnostic_tool = next((t for t in tools if t.name == "editor.asset.diagnostic"), None)
+    diagnostic_tool = tools_index.get("editor.asset.diagnostic")
 
     description = diagnostic_tool.description
+    hits = {token.lower() for token in _DESCRIPTION_TOKENS.findall(description)}
 
     # Description should mention supported asset types
-    supported_types = ["Level", "Blueprint", "Material", "StaticMesh"]
-    found_types = [t for t in supported_types if t.lower() in description.lower()]
-
-    print(f"Description mentions asset types: {found_types}")
+    found_types = sorted(hits & SUPPORTED_TYPES)
+    logger.debug("Description mentions asset types: %s", found_types)
 
     # Description should explain return format
-    return_fields = ["success", "asset_type", "issues", "errors", "warnings"]
-    found_fields = [f for f in return_fields if f.lower() in description.lower()]
-
-    print(f"Description mentions return fields: {found_fields}")
+    found_fields = sorted(hits & RETURN_FIELDS)
+    logger.debug("Description mentions return fields: %s", found_fields)
 
 
 # =============================================================================
@@ -93,7 +113,6 @@ async def test_diagnostic_tool_description(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_diagnostic_missing_asset_path(tool_caller):
     """Test diagnostic with missing asset_path parameter."""
@@ -103,10 +122,9 @@ async def test_diagnostic_missing_asset_path(tool_caller):
         expect_error=True,
     )
 
-    print(f"Missing asset_path error: {result.error_message or result.text_content}")
+    logger.debug("Missing asset_path error: %s", result.error_message or result.text_content)
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_diagnostic_empty_asset_path(tool_caller):
     """Test diagnostic with empty asset_path."""
@@ -115,8 +133,8 @@ async def test_diagnostic_empty_asset_path(tool_caller):
         arguments={"asset_path": ""},
     )
 
-    diag_data = json.loads(result.text_content)
-    print(f"Empty asset_path result: {json.dumps(diag_data, indent=2)}")
+    diag_data = result.json_content
+    logger.debug("Empty asset_path result: %s", diag_data)
 
 
 # =============================================================================
@@ -124,20 +142,33 @@ async def test_diagnostic_empty_asset_path(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
-async def test_diagnostic_level_asset(tool_caller):
-    """Test running diagnostics on a Level asset."""
+@pytest.mark.parametrize(
+    "asset_path,expected_types",
+    [
+        pytest.param(TEST_LEVEL, None, id="level"),
+        pytest.param(
+            "/Game/Blueprints/TestBlueprint",
+            {"Blueprint", "Actor Blueprint", "Unknown"},
+            id="blueprint",
+        ),
+        pytest.param("/Game/Materials/TestMaterial", None, id="material"),
+        pytest.param("/Game/Meshes/TestMesh", None, id="static_mesh"),
+        pytest.param("/Game/Textures/TestTexture", None, id="texture"),
+    ],
+)
+async def test_diagnostic_asset(tool_caller, asset_path, expected_types):
+    """Test running diagnostics on each supported asset type."""
     result = await tool_caller.call(
         "editor.asset.diagnostic",
         arguments={
-            "asset_path": "/Game/Maps/TestLevel",
+            "asset_path": asset_path,
         },
     )
 
-    diag_data = json.loads(result.text_content)
-    print(f"Level diagnostic: {json.dumps(diag_data, indent=2)}")
+    diag_data = result.json_content
+    logger.debug("Diagnostic for %s: %s", asset_path, diag_data)
 
     if diag_data.get("success"):
         # Check expected response structure
@@ -147,72 +178,8 @@ async def test_diagnostic_level_asset(tool_caller):
         assert "errors" in diag_data, "Should contain error count"
         assert "warnings" in diag_data, "Should contain warning count"
 
-
-@pytest.mark.asyncio
-@pytest.mark.integration
-@pytest.mark.requires_editor
-async def test_diagnostic_blueprint_asset(tool_caller):
-    """Test running diagnostics on a Blueprint asset."""
-    result = await tool_caller.call(
-        "editor.asset.diagnostic",
-        arguments={
-            "asset_path": "/Game/Blueprints/TestBlueprint",
-        },
-    )
-
-    diag_data = json.loads(result.text_content)
-    print(f"Blueprint diagnostic: {json.dumps(diag_data, indent=2)}")
-
-    if diag_data.get("success"):
-        assert diag_data.get("asset_type") in ["Blueprint", "Actor Blueprint", "Unknown"]
-
-
-@pytest.mark.asyncio
-@pytest.mark.integration
-@pytest.mark.requires_editor
-async def test_diagnostic_material_asset(tool_caller):
-    """Test running diagnostics on a Material asset."""
-    result = await tool_caller.call(
-        "editor.asset.diagnostic",
-        arguments={
-            "asset_path": "/Game/Materials/TestMaterial",
-        },
-    )
-
-    diag_data = json.loads(result.text_content)
-    print(f"Material diagnostic: {json.dumps(diag_data, indent=2)}")
-
-
-@pytest.mark.asyncio
-@pytest.mark.integration
-@pytest.mark.requires_editor
-async def test_diagnostic_static_mesh_asset(tool_caller):
-    """Test running diagnostics on a StaticMesh asset."""
-    result = await tool_caller.call(
-        "editor.asset.diagnostic",
-        arguments={
-            "asset_path": "/Game/Meshes/TestMesh",
-        },
-    )
-
-    diag_data = json.loads(result.text_content)
-    print(f"StaticMesh diagnostic: {json.dumps(diag_data, indent=2)}")
-
-
-@pytest.mark.asyncio
-@pytest.mark.integration
-@pytest.mark.requires_editor
-async def test_diagnostic_texture_asset(tool_caller):
-    """Test running diagnostics on a Texture asset."""
-    result = await tool_caller.call(
-        "editor.asset.diagnostic",
-        arguments={
-            "asset_path": "/Game/Textures/TestTexture",
-        },
-    )
-
-    diag_data = json.loads(result.text_content)
-    print(f"Texture diagnostic: {json.dumps(diag_data, indent=2)}")
+        if expected_types is not None:
+            assert diag_data.get("asset_type") in expected_types
 
 
 # =============================================================================
@@ -220,7 +187,6 @@ async def test_diagnostic_texture_asset(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_diagnostic_response_structure(tool_caller):
@@ -228,11 +194,11 @@ async def test_diagnostic_response_structure(tool_caller):
     result = await tool_caller.call(
         "editor.asset.diagnostic",
         arguments={
-            "asset_path": "/Game/Maps/TestLevel",
+            "asset_path": TEST_LEVEL,
         },
     )
 
-    diag_data = json.loads(result.text_content)
+    diag_data = result.json_content
 
     if diag_data.get("success"):
         # Verify required fields
@@ -252,10 +218,9 @@ async def test_diagnostic_response_structure(tool_caller):
             for field in issue_fields:
                 assert field in first_issue, f"Issue should contain '{field}'"
 
-        print(f"Response structure valid. Found {len(issues)} issues.")
+        logger.debug("Response structure valid. Found %s issues.", len(issues))
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_diagnostic_issue_severity_levels(tool_caller):
@@ -263,26 +228,26 @@ async def test_diagnostic_issue_severity_levels(tool_caller):
     result = await tool_caller.call(
         "editor.asset.diagnostic",
         arguments={
-            "asset_path": "/Game/Maps/TestLevel",
+            "asset_path": TEST_LEVEL,
         },
     )
 
-    diag_data = json.loads(result.text_content)
+    diag_data = result.json_content
 
     if diag_data.get("success"):
         issues = diag_data.get("issues", [])
-        valid_severities = ["error", "warning", "info", "suggestion"]
-
-        for issue in issues:
-            severity = issue.get("severity", "").lower()
-            assert severity in valid_severities, \
-                f"Invalid severity: {severity}"
+        valid_severities = {"error", "warning", "info", "suggestion"}
 
         # Count by severity
-        error_count = sum(1 for i in issues if i.get("severity", "").lower() == "error")
-        warning_count = sum(1 for i in issues if i.get("severity", "").lower() == "warning")
-
-        print(f"Severity breakdown: {error_count} errors, {warning_count} warnings")
+        counts = Counter(issue.get("severity", "").lower() for issue in issues)
+        invalid = counts.keys() - valid_severities
+        assert not invalid, f"Invalid severity: {sorted(invalid)}"
+
+        logger.debug(
+            "Severity breakdown: %s errors, %s warnings",
+            counts["error"],
+            counts["warning"],
+        )
 
 
 # =============================================================================
@@ -290,7 +255,6 @@ async def test_diagnostic_issue_severity_levels(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_diagnostic_nonexistent_asset(tool_caller):
     """Test diagnostic on non-existent asset."""
@@ -301,55 +265,52 @@ async def test_diagnostic_nonexistent_asset(tool_caller):
         },
     )
 
-    diag_data = json.loads(result.text_content)
-    print(f"Non-existent asset: {json.dumps(diag_data, indent=2)}")
+    diag_data = result.json_content
+    logger.debug("Non-existent asset: %s", diag_data)
 
     # Should fail gracefully
     if not diag_data.get("success"):
         assert "error" in diag_data, "Should contain error message"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
-async def test_diagnostic_invalid_asset_path_format(tool_caller):
-    """Test diagnostic with invalid asset path format."""
-    invalid_paths = [
+@pytest.mark.parametrize(
+    "invalid_path",
+    [
         "not/a/valid/path",  # Missing /Game prefix
         "Game/Maps/Test",    # Missing leading slash
         "/InvalidRoot/Asset",  # Invalid root
-    ]
-
-    for invalid_path in invalid_paths:
-        result = await tool_caller.call(
-            "editor.asset.diagnostic",
-            arguments={
-                "asset_path": invalid_path,
-            },
-        )
+    ],
+)
+async def test_diagnostic_invalid_asset_path_format(tool_caller, invalid_path):
+    """Test diagnostic with invalid asset path format."""
+    result = await tool_caller.call(
+        "editor.asset.diagnostic",
+        arguments={
+            "asset_path": invalid_path,
+        },
+    )
 
-        diag_data = json.loads(result.text_content)
-        print(f"Invalid path '{invalid_path}': success={diag_data.get('success')}")
+    diag_data = result.json_content
+    logger.info("Invalid path '%s': success=%s", invalid_path, diag_data.get("success"))
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
-async def test_diagnostic_without_editor(tool_caller, editor_status_checker):
+@pytest.mark.without_editor
+async def test_diagnostic_without_editor(tool_caller):
     """Test diagnostic when editor is not running."""
-    status = await editor_status_checker()
-
-    if status.get("status") not in ["ready"]:
-        result = await tool_caller.call(
-            "editor.asset.diagnostic",
-            arguments={
-                "asset_path": "/Game/Maps/TestLevel",
-            },
-        )
+    result = await tool_caller.call(
+        "editor.asset.diagnostic",
+        arguments={
+            "asset_path": TEST_LEVEL,
+        },
+    )
 
-        diag_data = json.loads(result.text_content)
-        print(f"Diagnostic without editor: {json.dumps(diag_data, indent=2)}")
+    diag_data = result.json_content
+    logger.debug("Diagnostic without editor: %s", diag_data)
 
-        # Should fail gracefully
-        assert not diag_data.get("success")
+    # Should fail gracefully
+    assert not diag_data.get("success")
 
 
 # =============================================================================
@@ -357,34 +318,30 @@ async def test_diagnostic_without_editor(tool_caller, editor_status_checker):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_diagnostic_multiple_assets(tool_caller):
-    """Test running diagnostics on multiple assets sequentially."""
+    """Test running diagnostics on multiple assets in one batch."""
     assets_to_test = [
-        "/Game/Maps/TestLevel",
+        TEST_LEVEL,
         "/Game/Blueprints/TestBP",
         "/Game/Materials/TestMat",
     ]
 
-    results = {}
-    for asset_path in assets_to_test:
-        result = await tool_caller.call(
-            "editor.asset.diagnostic",
-            arguments={"asset_path": asset_path},
-        )
-
-        diag_data = json.loads(result.text_content)
-        results[asset_path] = diag_data
+    batch = await tool_caller.call_many(
+        [("editor.asset.diagnostic", {"asset_path": p}) for p in assets_to_test]
+    )
+    results = {path: r.json_content for path, r in zip(assets_to_test, batch)}
 
-    print("Multiple asset diagnostics:")
     for path, data in results.items():
-        success = data.get("success", False)
-        asset_type = data.get("asset_type", "Unknown")
-        errors = data.get("errors", 0)
-        warnings = data.get("warnings", 0)
-        print(f"  {path}: success={success}, type={asset_type}, errors={errors}, warnings={warnings}")
+        logger.info(
+            "%s: success=%s, type=%s, errors=%s, warnings=%s",
+            path,
+            data.get("success", False),
+            data.get("asset_type", "Unknown"),
+            data.get("errors", 0),
+            data.get("warnings", 0),
+        )
 
 
 # =============================================================================
@@ -392,56 +349,31 @@ async def test_diagnostic_multiple_assets(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_diagnostic_response_format(tool_caller):
     """Test that diagnostic returns properly formatted response."""
-    # Custom assertion for response format
-    valid_response = CustomAssertion(
-        check_func=lambda r: (
-            "success" in json.loads(r.text_content)
-            or "error" in json.loads(r.text_content)
-        ),
-        description="Response should contain 'success' or 'error'",
-    )
-
     result = await tool_caller.call_and_assert(
         "editor.asset.diagnostic",
-        arguments={"asset_path": "/Game/Maps/TestLevel"},
+        arguments={"asset_path": TEST_LEVEL},
         assertions=[
             SuccessAssertion(),  # MCP call succeeds
-            valid_response,
+            _VALID_DIAGNOSTIC_RESPONSE,
         ],
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_diagnostic_with_full_assertions(tool_caller):
     """Test diagnostic with comprehensive assertions."""
-    # Custom assertion for successful diagnostic
-    diagnostic_succeeded = CustomAssertion(
-        check_func=lambda r: json.loads(r.text_content).get("success", False),
-        description="Diagnostic should succeed",
-        message_func=lambda r: f"Diagnostic failed: {json.loads(r.text_content).get('error', 'Unknown')}",
-    )
-
-    # Custom assertion for proper structure
-    has_issues_list = CustomAssertion(
-        check_func=lambda r: "issues" in json.loads(r.text_content) and \
-            isinstance(json.loads(r.text_content).get("issues"), list),
-        description="Response should have issues list",
-    )
-
     result = await tool_caller.call_and_assert(
         "editor.asset.diagnostic",
-        arguments={"asset_path": "/Game/Maps/TestLevel"},
+        arguments={"asset_path": TEST_LEVEL},
         assertions=[
             SuccessAssertion(),
             DurationAssertion(max_seconds=60),
-            diagnostic_succeeded,
-            has_issues_list,
+            _DIAGNOSTIC_SUCCEEDED,
+            _HAS_ISSUES_LIST,
         ],
     )
 
@@ -451,7 +383,6 @@ async def test_diagnostic_with_full_assertions(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 @pytest.mark.slow
@@ -464,18 +395,17 @@ async def test_diagnostic_large_level(tool_caller):
         },
     )
 
-    diag_data = json.loads(result.text_content)
-    print(f"Large level diagnostic: {diag_data}")
+    diag_data = result.json_content
+    logger.debug("Large level diagnostic: %s", diag_data)
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_diagnostic_call_history(tool_caller):
     """Test that diagnostic calls are tracked in history."""
     # Make diagnostic call
     await tool_caller.call(
         "editor.asset.diagnostic",
-        arguments={"asset_path": "/Game/Maps/TestLevel"},
+        arguments={"asset_path": TEST_LEVEL},
     )
 
     # Check history
@@ -483,11 +413,11 @@ async def test_diagnostic_call_history(tool_caller):
     assert len(diag_calls) >= 1, "Should have diagnostic calls in history"
 
     last_call = diag_calls[-1]
-    assert last_call.arguments.get("asset_path") == "/Game/Maps/TestLevel"
+    assert last_call.arguments.get("asset_path") == TEST_LEVEL
 
-    print(f"Diagnostic call tracked: {last_call.name}")
-    print(f"  Arguments: {last_call.arguments}")
-    print(f"  Duration: {last_call.duration_seconds:.2f}s")
+    logger.debug("Diagnostic call tracked: %s", last_call.name)
+    logger.debug("  Arguments: %s", last_call.arguments)
+    logger.debug("  Duration: %.2fs", last_call.duration_seconds)
 
 
 # =============================================================================
@@ -495,7 +425,6 @@ async def test_diagnostic_call_history(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_diagnostic_special_characters_in_path(tool_caller):
     """Test diagnostic with special characters in asset path."""
@@ -505,17 +434,15 @@ async def test_diagnostic_special_characters_in_path(tool_caller):
         "/Game/Maps/Test-Level",      # Hyphen
     ]
 
-    for path in special_paths:
-        result = await tool_caller.call(
-            "editor.asset.diagnostic",
-            arguments={"asset_path": path},
-        )
+    batch = await tool_caller.call_many(
+        [("editor.asset.diagnostic", {"asset_path": p}) for p in special_paths]
+    )
 
-        diag_data = json.loads(result.text_content)
-        print(f"Special path '{path}': success={diag_data.get('success')}")
+    for path, result in zip(special_paths, batch):
+        diag_data = result.json_content
+        logger.info("Special path '%s': success=%s", path, diag_data.get("success"))
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_diagnostic_unicode_asset_path(tool_caller):
     """Test diagnostic with unicode characters in path."""
@@ -526,5 +453,5 @@ async def test_diagnostic_unicode_asset_path(tool_caller):
         },
     )
 
-    diag_data = json.loads(result.text_content)
-    print(f"Unicode path result: {diag_data}")
+    diag_data = result.json_content
+    logger.debug("Unicode path result: %s", diag_data)
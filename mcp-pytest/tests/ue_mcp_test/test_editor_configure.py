@@ -5,62 +5,79 @@ Tests the following tools:
 - editor.configure: Check and fix project configuration
 - editor.pip_install: Install Python packages in UE5
 
+The editor.execute schema is checked here too, next to the other editor
+tool schemas; its execution tests live in test_editor_execute.py.
+
 Run with:
     cd tests/ue_mcp_test
     pytest test_editor_configure.py -v
 """
 
-import json
+import logging
 
 import pytest
 
 from mcp_pytest import (
     CustomAssertion,
     DurationAssertion,
+    JsonFieldsPresentAssertion,
     SuccessAssertion,
+    ToolCaller,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Assertion for pip_install responses, which report either success or an error
+_VALID_PIP_INSTALL_RESPONSE = JsonFieldsPresentAssertion({"success", "error"}, require_all=False)
+
+# Assertion for configure responses, which report their checks as a JSON object
+_CONFIGURE_RESPONSE_IS_OBJECT = CustomAssertion(
+    check_func=lambda data: isinstance(data, dict),
+    description="Response should be a dictionary",
+    parse_json=True,
 )
 
 
 # =============================================================================
-# editor.configure Tool Schema Tests
+# Tool Schema Tests
 # =============================================================================
 
 
-@pytest.mark.asyncio
-@pytest.mark.unit
-async def test_configure_tool_exists(mcp_client):
-    """Test that editor.configure tool exists."""
-    tools = await mcp_client.list_tools()
-    tool_names = [t.name for t in tools]
-
-    assert "editor.configure" in tool_names, "editor.configure tool should exist"
+# (tool name, expected parameters, required parameters)
+EXPECTED_SCHEMAS = [
+    ("editor.configure", {"auto_fix", "additional_paths"}, set()),
+    ("editor.pip_install", {"packages", "upgrade"}, {"packages"}),
+    ("editor.execute", {"code", "timeout"}, {"code"}),
+]
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_configure_tool_schema(tool_caller):
-    """Test editor.configure tool schema and parameters."""
-    tools = await tool_caller.client.list_tools()
-    configure_tool = next((t for t in tools if t.name == "editor.configure"), None)
+@pytest.mark.parametrize(
+    "name,params,required", EXPECTED_SCHEMAS, ids=[name for name, _, _ in EXPECTED_SCHEMAS]
+)
+async def test_tool_schema(tools_index, name, params, required):
+    """Test that the tool exists and declares the expected parameters."""
+    tool = tools_index.get(name)
 
-    assert configure_tool is not None, "editor.configure tool should exist"
-    assert configure_tool.description, "Should have description"
-    assert configure_tool.inputSchema, "Should have input schema"
+    assert tool is not None, f"{name} tool should exist"
+    assert tool.description, "Should have description"
+    assert tool.inputSchema, "Should have input schema"
 
-    schema = configure_tool.inputSchema
+    schema = tool.inputSchema
     props = schema.get("properties", {})
+    schema_required = schema.get("required", [])
 
-    # Verify expected parameters
-    assert "auto_fix" in props, "Should accept 'auto_fix' parameter"
-    assert "additional_paths" in props, "Should accept 'additional_paths' parameter"
+    missing = params - props.keys()
+    assert not missing, f"Should accept parameters: {sorted(missing)}"
 
-    print("editor.configure schema:")
-    print(f"  Description: {configure_tool.description[:150]}...")
-    print(f"  Parameters: {list(props.keys())}")
+    not_required = required.difference(schema_required)
+    assert not not_required, f"Should require parameters: {sorted(not_required)}"
 
-    # Check auto_fix default
-    auto_fix_prop = props.get("auto_fix", {})
-    print(f"  auto_fix type: {auto_fix_prop.get('type')}")
+    logger.debug("%s schema:", name)
+    logger.debug("  Description: %s...", tool.description[:150])
+    logger.debug("  Parameters: %s", list(props.keys()))
+    logger.debug("  Required: %s", schema_required)
 
 
 # =============================================================================
@@ -68,7 +85,6 @@ async def test_configure_tool_schema(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_configure_check_only(tool_caller):
     """Test configuration check without auto-fix."""
@@ -81,14 +97,13 @@ async def test_configure_check_only(tool_caller):
 
     assert result.success, f"Configuration check failed: {result.error_message}"
 
-    config_data = json.loads(result.text_content)
-    print(f"Configuration check result: {json.dumps(config_data, indent=2)}")
+    config_data = result.json_content
+    logger.debug("Configuration check result: %s", config_data)
 
     # Should return check results
     # The response structure depends on implementation
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_configure_with_auto_fix(tool_caller):
     """Test configuration with auto-fix enabled."""
@@ -99,11 +114,10 @@ async def test_configure_with_auto_fix(tool_caller):
         },
     )
 
-    config_data = json.loads(result.text_content)
-    print(f"Auto-fix result: {json.dumps(config_data, indent=2)}")
+    config_data = result.json_content
+    logger.debug("Auto-fix result: %s", config_data)
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_configure_with_additional_paths(tool_caller, temp_output_dir):
     """Test configuration with additional Python paths."""
@@ -118,11 +132,10 @@ async def test_configure_with_additional_paths(tool_caller, temp_output_dir):
         },
     )
 
-    config_data = json.loads(result.text_content)
-    print(f"Configure with paths: {json.dumps(config_data, indent=2)}")
+    config_data = result.json_content
+    logger.debug("Configure with paths: %s", config_data)
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_configure_multiple_paths(tool_caller, temp_output_dir):
     """Test configuration with multiple additional paths."""
@@ -140,8 +153,8 @@ async def test_configure_multiple_paths(tool_caller, temp_output_dir):
         },
     )
 
-    config_data = json.loads(result.text_content)
-    print(f"Multiple paths result: {config_data}")
+    config_data = result.json_content
+    logger.debug("Multiple paths result: %s", config_data)
 
 
 # =============================================================================
@@ -149,7 +162,6 @@ async def test_configure_multiple_paths(tool_caller, temp_output_dir):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_configure_validates_project(tool_caller):
     """Test that configure validates the UE project."""
@@ -158,86 +170,31 @@ async def test_configure_validates_project(tool_caller):
         arguments={"auto_fix": False},
     )
 
-    config_data = json.loads(result.text_content)
+    config_data = result.json_content
 
     # Should check Python plugin
     # Should check remote execution settings
     # Should check Python paths
 
     # The exact fields depend on implementation
-    print(f"Validation result: {config_data}")
+    logger.debug("Validation result: %s", config_data)
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_configure_response_structure(tool_caller):
     """Test that configure returns expected response structure."""
-    result = await tool_caller.call(
+    await tool_caller.call_and_assert(
         "editor.configure",
         arguments={"auto_fix": False},
+        assertions=[_CONFIGURE_RESPONSE_IS_OBJECT],
     )
 
-    config_data = json.loads(result.text_content)
-
-    # Custom assertion for response structure
-    has_check_results = CustomAssertion(
-        check_func=lambda r: isinstance(json.loads(r.text_content), dict),
-        description="Response should be a dictionary",
-    )
-
-    # Verify it's a valid response
-    assert isinstance(config_data, dict), "Should return a dictionary"
-
-
-# =============================================================================
-# editor.pip_install Tool Schema Tests
-# =============================================================================
-
-
-@pytest.mark.asyncio
-@pytest.mark.unit
-async def test_pip_install_tool_exists(mcp_client):
-    """Test that editor.pip_install tool exists."""
-    tools = await mcp_client.list_tools()
-    tool_names = [t.name for t in tools]
-
-    assert "editor.pip_install" in tool_names, "editor.pip_install tool should exist"
-
-
-@pytest.mark.asyncio
-@pytest.mark.unit
-async def test_pip_install_tool_schema(tool_caller):
-    """Test editor.pip_install tool schema and parameters."""
-    tools = await tool_caller.client.list_tools()
-    pip_tool = next((t for t in tools if t.name == "editor.pip_install"), None)
-
-    assert pip_tool is not None, "editor.pip_install tool should exist"
-    assert pip_tool.description, "Should have description"
-    assert pip_tool.inputSchema, "Should have input schema"
-
-    schema = pip_tool.inputSchema
-    props = schema.get("properties", {})
-    required = schema.get("required", [])
-
-    # Verify expected parameters
-    assert "packages" in props, "Should accept 'packages' parameter"
-    assert "upgrade" in props, "Should accept 'upgrade' parameter"
-
-    # Packages should be required
-    assert "packages" in required, "'packages' should be required"
-
-    print("editor.pip_install schema:")
-    print(f"  Description: {pip_tool.description[:150]}...")
-    print(f"  Parameters: {list(props.keys())}")
-    print(f"  Required: {required}")
-
 
 # =============================================================================
 # editor.pip_install Parameter Tests
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_pip_install_missing_packages(tool_caller):
     """Test pip_install with missing packages parameter."""
@@ -248,10 +205,9 @@ async def test_pip_install_missing_packages(tool_caller):
     )
 
     # Should fail validation
-    print(f"Missing packages error: {result.error_message or result.text_content}")
+    logger.debug("Missing packages error: %s", result.error_message or result.text_content)
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_pip_install_empty_packages(tool_caller):
     """Test pip_install with empty packages list."""
@@ -260,8 +216,8 @@ async def test_pip_install_empty_packages(tool_caller):
         arguments={"packages": []},
     )
 
-    pip_data = json.loads(result.text_content)
-    print(f"Empty packages result: {pip_data}")
+    pip_data = result.json_content
+    logger.debug("Empty packages result: %s", pip_data)
 
 
 # =============================================================================
@@ -269,35 +225,47 @@ async def test_pip_install_empty_packages(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
-@pytest.mark.integration
-@pytest.mark.slow
-async def test_pip_install_single_package(tool_caller):
-    """Test installing a single package.
+@pytest.fixture(scope="module")
+async def requests_install(mcp_client, mcp_config) -> dict:
+    """Install 'requests' once per module and return the parsed response.
 
-    Note: This test requires UE5 to be installed.
+    Package resolution and download dominate pip_install time, so the tests
+    that only need 'requests' present share this single install.
     """
-    result = await tool_caller.call(
+    caller = ToolCaller(mcp_client, default_timeout=mcp_config.default_timeout)
+    result = await caller.call(
         "editor.pip_install",
         arguments={
             "packages": ["requests"],  # Common, safe package
             "upgrade": False,
         },
     )
+    return result.json_content
 
-    pip_data = json.loads(result.text_content)
-    print(f"Install result: {json.dumps(pip_data, indent=2)}")
+
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_pip_install_single_package(requests_install):
+    """Test installing a single package.
+
+    Note: This test requires UE5 to be installed.
+    """
+    pip_data = requests_install
+    logger.debug("Install result: %s", pip_data)
 
     if pip_data.get("success"):
         assert "packages" in pip_data, "Should list installed packages"
         assert "python_path" in pip_data, "Should show Python path used"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.slow
-async def test_pip_install_multiple_packages(tool_caller):
-    """Test installing multiple packages."""
+async def test_pip_install_multiple_packages(tool_caller, requests_install):
+    """Test installing multiple packages.
+
+    'requests' is already present from requests_install, so only the other
+    packages are downloaded.
+    """
     result = await tool_caller.call(
         "editor.pip_install",
         arguments={
@@ -306,11 +274,10 @@ async def test_pip_install_multiple_packages(tool_caller):
         },
     )
 
-    pip_data = json.loads(result.text_content)
-    print(f"Multi-package install: {json.dumps(pip_data, indent=2)}")
+    pip_data = result.json_content
+    logger.debug("Multi-package install: %s", pip_data)
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.slow
 async def test_pip_install_with_upgrade(tool_caller):
@@ -323,11 +290,10 @@ async def test_pip_install_with_upgrade(tool_caller):
         },
     )
 
-    pip_data = json.loads(result.text_content)
-    print(f"Upgrade result: {json.dumps(pip_data, indent=2)}")
+    pip_data = result.json_content
+    logger.debug("Upgrade result: %s", pip_data)
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_pip_install_nonexistent_package(tool_caller):
     """Test installing a package that doesn't exist."""
@@ -339,8 +305,8 @@ async def test_pip_install_nonexistent_package(tool_caller):
         },
     )
 
-    pip_data = json.loads(result.text_content)
-    print(f"Nonexistent package result: {json.dumps(pip_data, indent=2)}")
+    pip_data = result.json_content
+    logger.debug("Nonexistent package result: %s", pip_data)
 
     # Should fail gracefully
     if not pip_data.get("success"):
@@ -353,7 +319,6 @@ async def test_pip_install_nonexistent_package(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_configure_then_pip_install(tool_caller):
     """Test running configure followed by pip_install."""
@@ -362,8 +327,8 @@ async def test_configure_then_pip_install(tool_caller):
         "editor.configure",
         arguments={"auto_fix": True},
     )
-    config_data = json.loads(config_result.text_content)
-    print(f"Configure: {config_data}")
+    config_data = config_result.json_content
+    logger.debug("Configure: %s", config_data)
 
     # Step 2: Install packages
     pip_result = await tool_caller.call(
@@ -373,8 +338,8 @@ async def test_configure_then_pip_install(tool_caller):
             "upgrade": False,
         },
     )
-    pip_data = json.loads(pip_result.text_content)
-    print(f"Pip install: {pip_data}")
+    pip_data = pip_result.json_content
+    logger.debug("Pip install: %s", pip_data)
 
 
 # =============================================================================
@@ -382,7 +347,6 @@ async def test_configure_then_pip_install(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_configure_with_assertions(tool_caller):
     """Test configure with assertion framework."""
@@ -396,21 +360,14 @@ async def test_configure_with_assertions(tool_caller):
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_pip_install_response_format(tool_caller):
     """Test that pip_install returns properly formatted response."""
-    # Custom assertion for response format
-    valid_response = CustomAssertion(
-        check_func=lambda r: "success" in json.loads(r.text_content) or "error" in json.loads(r.text_content),
-        description="Response should contain 'success' or 'error' field",
-    )
-
     result = await tool_caller.call_and_assert(
         "editor.pip_install",
         arguments={"packages": []},
         assertions=[
             SuccessAssertion(),
-            valid_response,
+            _VALID_PIP_INSTALL_RESPONSE,
         ],
     )
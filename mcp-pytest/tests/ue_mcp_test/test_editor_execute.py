@@ -9,59 +9,21 @@ Run with:
     pytest test_editor_execute.py -v
 """
 
-import json
+import logging
+import re
 
 import pytest
 
 from mcp_pytest import (
     CustomAssertion,
     DurationAssertion,
+    JsonFieldContainsAssertion,
     ResultContainsAssertion,
     SuccessAssertion,
 )
 
 
-# =============================================================================
-# Tool Schema Tests
-# =============================================================================
-
-
-@pytest.mark.asyncio
-@pytest.mark.unit
-async def test_execute_tool_exists(mcp_client):
-    """Test that editor.execute tool exists."""
-    tools = await mcp_client.list_tools()
-    tool_names = [t.name for t in tools]
-
-    assert "editor.execute" in tool_names, "editor.execute tool should exist"
-
-
-@pytest.mark.asyncio
-@pytest.mark.unit
-async def test_execute_tool_schema(tool_caller):
-    """Test editor.execute tool schema and parameters."""
-    tools = await tool_caller.client.list_tools()
-    execute_tool = next((t for t in tools if t.name == "editor.execute"), None)
-
-    assert execute_tool is not None, "editor.execute tool should exist"
-    assert execute_tool.description, "Should have description"
-    assert execute_tool.inputSchema, "Should have input schema"
-
-    schema = execute_tool.inputSchema
-    props = schema.get("properties", {})
-    required = schema.get("required", [])
-
-    # Verify expected parameters
-    assert "code" in props, "Should accept 'code' parameter"
-    assert "timeout" in props, "Should accept 'timeout' parameter"
-
-    # Code should be required
-    assert "code" in required, "'code' should be required"
-
-    print("editor.execute schema:")
-    print(f"  Description: {execute_tool.description[:100]}...")
-    print(f"  Parameters: {list(props.keys())}")
-    print(f"  Required: {required}")
+logger = logging.getLogger(__name__)
 
 
 # =============================================================================
@@ -69,7 +31,6 @@ async def test_execute_tool_schema(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_execute_missing_code_parameter(tool_caller):
     """Test that missing code parameter is handled."""
@@ -82,15 +43,13 @@ async def test_execute_missing_code_parameter(tool_caller):
 
     # Should fail validation
     assert result.success, "Should fail when code is missing"
-    print(f"Error (expected): {result.error_message or result.text_content}")
+    logger.debug("Error (expected): %s", result.error_message or result.text_content)
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_execute_with_timeout_parameter(tool_caller):
+async def test_execute_with_timeout_parameter(tools_index):
     """Test that timeout parameter is accepted."""
-    tools = await tool_caller.client.list_tools()
-    execute_tool = next((t for t in tools if t.name == "editor.execute"), None)
+    execute_tool = tools_index.get("editor.execute")
 
     props = execute_tool.inputSchema.get("properties", {})
     timeout_prop = props.get("timeout", {})
@@ -99,7 +58,7 @@ async def test_execute_with_timeout_parameter(tool_caller):
     assert "default" in timeout_prop or timeout_prop.get("type") == "number", \
         "timeout should be a number with default"
 
-    print(f"Timeout property: {timeout_prop}")
+    logger.debug("Timeout property: %s", timeout_prop)
 
 
 # =============================================================================
@@ -107,7 +66,27 @@ async def test_execute_with_timeout_parameter(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
+# Python payloads sent to the editor by the execution tests
+MULTILINE_PROJECT_NAME_CODE = """
+import unreal
+
+def get_project_name():
+    settings = unreal.SystemLibrary.get_project_name()
+    return settings
+
+name = get_project_name()
+print(f"Project: {name}")
+"""
+
+LIST_ASSETS_CODE = """
+import unreal
+assets = unreal.EditorAssetLibrary.list_assets('/Game/')
+print(f"Found {len(assets)} assets")
+for asset in assets[:5]:
+    print(f"  - {asset}")
+"""
+
+
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_execute_simple_print(tool_caller):
@@ -120,18 +99,20 @@ async def test_execute_simple_print(tool_caller):
         },
     )
 
-    exec_data = json.loads(result.text_content)
-    print(f"Execution result: {json.dumps(exec_data, indent=2)}")
+    exec_data = result.json_content
+    logger.debug("Execution result: %s", exec_data)
 
     if exec_data.get("success"):
         assert "Hello from UE5" in exec_data.get("output", ""), \
             "Output should contain printed message"
     else:
         # May fail if editor not running
-        print(f"Execution failed (expected if editor not running): {exec_data.get('error')}")
+        logger.debug(
+            "Execution failed (expected if editor not running): %s",
+            exec_data.get("error"),
+        )
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_execute_import_unreal(tool_caller):
@@ -144,16 +125,15 @@ async def test_execute_import_unreal(tool_caller):
         },
     )
 
-    exec_data = json.loads(result.text_content)
+    exec_data = result.json_content
 
     if exec_data.get("success"):
-        print("Successfully executed unreal import!")
-        print(f"Output: {exec_data.get('output')}")
+        logger.debug("Successfully executed unreal import!")
+        logger.debug("Output: %s", exec_data.get("output"))
     else:
-        print(f"Failed (expected if editor not running): {exec_data.get('error')}")
+        logger.debug("Failed (expected if editor not running): %s", exec_data.get("error"))
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_execute_with_return_value(tool_caller):
@@ -166,42 +146,29 @@ async def test_execute_with_return_value(tool_caller):
         },
     )
 
-    exec_data = json.loads(result.text_content)
+    exec_data = result.json_content
 
     if exec_data.get("success"):
         assert "Result: 4" in exec_data.get("output", ""), \
             "Should contain calculation result"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_execute_multiline_code(tool_caller):
     """Test executing multiline Python code."""
-    multiline_code = """
-import unreal
-
-def get_project_name():
-    settings = unreal.SystemLibrary.get_project_name()
-    return settings
-
-name = get_project_name()
-print(f"Project: {name}")
-"""
-
     result = await tool_caller.call(
         "editor.execute",
         arguments={
-            "code": multiline_code,
+            "code": MULTILINE_PROJECT_NAME_CODE,
             "timeout": 15.0,
         },
     )
 
-    exec_data = json.loads(result.text_content)
-    print(f"Multiline execution result: {exec_data}")
+    exec_data = result.json_content
+    logger.debug("Multiline execution result: %s", exec_data)
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_execute_list_assets(tool_caller):
@@ -209,18 +176,12 @@ async def test_execute_list_assets(tool_caller):
     result = await tool_caller.call(
         "editor.execute",
         arguments={
-            "code": """
-import unreal
-assets = unreal.EditorAssetLibrary.list_assets('/Game/')
-print(f"Found {len(assets)} assets")
-for asset in assets[:5]:
-    print(f"  - {asset}")
-""",
+            "code": LIST_ASSETS_CODE,
             "timeout": 20.0,
         },
     )
 
-    exec_data = json.loads(result.text_content)
+    exec_data = result.json_content
 
     if exec_data.get("success"):
         assert "Found" in exec_data.get("output", ""), \
@@ -232,7 +193,6 @@ for asset in assets[:5]:
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_execute_syntax_error(tool_caller):
@@ -245,15 +205,14 @@ async def test_execute_syntax_error(tool_caller):
         },
     )
 
-    exec_data = json.loads(result.text_content)
-    print(f"Syntax error result: {exec_data}")
+    exec_data = result.json_content
+    logger.debug("Syntax error result: %s", exec_data)
 
     # Should fail with syntax error
     if not exec_data.get("success"):
         assert "error" in exec_data, "Should contain error message"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_execute_runtime_error(tool_caller):
@@ -266,11 +225,10 @@ async def test_execute_runtime_error(tool_caller):
         },
     )
 
-    exec_data = json.loads(result.text_content)
-    print(f"Runtime error result: {exec_data}")
+    exec_data = result.json_content
+    logger.debug("Runtime error result: %s", exec_data)
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_execute_import_error(tool_caller):
@@ -283,8 +241,8 @@ async def test_execute_import_error(tool_caller):
         },
     )
 
-    exec_data = json.loads(result.text_content)
-    print(f"Import error result: {exec_data}")
+    exec_data = result.json_content
+    logger.debug("Import error result: %s", exec_data)
 
 
 # =============================================================================
@@ -292,7 +250,6 @@ async def test_execute_import_error(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 @pytest.mark.slow
@@ -307,14 +264,13 @@ async def test_execute_with_custom_timeout(tool_caller):
         },
     )
 
-    exec_data = json.loads(result.text_content)
+    exec_data = result.json_content
 
     if exec_data.get("success"):
         # Verify timing if available
-        print(f"Execution completed within timeout")
+        logger.debug("Execution completed within timeout")
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 @pytest.mark.slow
@@ -334,8 +290,8 @@ for i in range(1000):
         },
     )
 
-    exec_data = json.loads(result.text_content)
-    print(f"Timeout test result: {exec_data}")
+    exec_data = result.json_content
+    logger.debug("Timeout test result: %s", exec_data)
 
     # Should either timeout or be cancelled
     # The actual behavior depends on the remote execution implementation
@@ -346,29 +302,25 @@ for i in range(1000):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_execute_without_editor(tool_caller, editor_status_checker):
+@pytest.mark.without_editor
+async def test_execute_without_editor(tool_caller):
     """Test execute when editor is not running."""
-    # First check if editor is running
-    status = await editor_status_checker()
-
-    if status.get("status") not in ["ready"]:
-        # Editor not running, execute should fail gracefully
-        result = await tool_caller.call(
-            "editor.execute",
-            arguments={
-                "code": "print('test')",
-                "timeout": 5.0,
-            },
-        )
+    # Editor not running, execute should fail gracefully
+    result = await tool_caller.call(
+        "editor.execute",
+        arguments={
+            "code": "print('test')",
+            "timeout": 5.0,
+        },
+    )
 
-        exec_data = json.loads(result.text_content)
-        print(f"Execute without editor: {exec_data}")
+    exec_data = result.json_content
+    logger.debug("Execute without editor: %s", exec_data)
 
-        # Should fail with appropriate error
-        assert not exec_data.get("success") or "error" in str(exec_data).lower(), \
-            "Should fail or error when editor not running"
+    # Should fail with appropriate error
+    assert not exec_data.get("success") or "error" in str(exec_data).lower(), \
+        "Should fail or error when editor not running"
 
 
 # =============================================================================
@@ -376,31 +328,44 @@ async def test_execute_without_editor(tool_caller, editor_status_checker):
 # =============================================================================
 
 
-@pytest.mark.asyncio
+# Editor API expressions probed by test_execute_access_editor_api
+EDITOR_API_CASES = [
+    ("Get editor world", "unreal.EditorLevelLibrary.get_editor_world()"),
+    ("Get viewport camera", "unreal.EditorLevelLibrary.get_level_viewport_camera_info()"),
+    ("Get selected actors", "unreal.EditorLevelLibrary.get_selected_level_actors()"),
+]
+
+# All cases run in one script; each prints a "---name---" header line and
+# errors are caught per case so one failing API does not hide the others
+EDITOR_API_CODE = "import unreal\n" + "".join(
+    f"print('---{name}---')\n"
+    f"try:\n    print({expr})\nexcept Exception as e:\n    print(f'Error: {{e}}')\n"
+    for name, expr in EDITOR_API_CASES
+)
+
+_SECTION_HEADER = re.compile(r"^---(.+)---$", re.MULTILINE)
+
+
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_execute_access_editor_api(tool_caller):
     """Test accessing various editor APIs."""
-    test_cases = [
-        ("Get editor world", "import unreal; print(unreal.EditorLevelLibrary.get_editor_world())"),
-        ("Get viewport camera", "import unreal; print(unreal.EditorLevelLibrary.get_level_viewport_camera_info())"),
-        ("Get selected actors", "import unreal; print(unreal.EditorLevelLibrary.get_selected_level_actors())"),
-    ]
-
-    for name, code in test_cases:
-        result = await tool_caller.call(
-            "editor.execute",
-            arguments={"code": code, "timeout": 10.0},
-        )
+    result = await tool_caller.call(
+        "editor.execute",
+        arguments={"code": EDITOR_API_CODE, "timeout": 15.0},
+    )
 
-        exec_data = json.loads(result.text_content)
-        print(f"\n{name}:")
-        print(f"  Success: {exec_data.get('success')}")
-        if exec_data.get("output"):
-            print(f"  Output: {exec_data.get('output')[:200]}")
+    exec_data = result.json_content
+    logger.debug("Success: %s", exec_data.get("success"))
+
+    parts = _SECTION_HEADER.split(exec_data.get("output") or "")
+    sections = dict(zip(parts[1::2], parts[2::2]))
+    for name, _ in EDITOR_API_CASES:
+        logger.debug("%s:", name)
+        if sections.get(name, "").strip():
+            logger.debug("  Output: %s", sections[name].strip()[:200])
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_execute_create_actor(tool_caller):
@@ -437,8 +402,8 @@ else:
         arguments={"code": create_code, "timeout": 15.0},
     )
 
-    exec_data = json.loads(result.text_content)
-    print(f"Create actor result: {exec_data}")
+    exec_data = result.json_content
+    logger.debug("Create actor result: %s", exec_data)
 
 
 # =============================================================================
@@ -446,18 +411,18 @@ else:
 # =============================================================================
 
 
-@pytest.mark.asyncio
+_EXECUTION_SUCCEEDED = CustomAssertion(
+    check_func=lambda data: data.get("success", False),
+    description="Execution should succeed",
+    message_func=lambda data: f"Execution failed: {data.get('error', 'Unknown')}",
+    parse_json=True,
+)
+
+
 @pytest.mark.integration
 @pytest.mark.requires_editor
 async def test_execute_with_success_assertion(tool_caller):
     """Test execute with assertion framework."""
-    # Custom assertion for successful execution
-    successful_execution = CustomAssertion(
-        check_func=lambda r: json.loads(r.text_content).get("success", False),
-        description="Execution should succeed",
-        message_func=lambda r: f"Execution failed: {json.loads(r.text_content).get('error', 'Unknown')}",
-    )
-
     result = await tool_caller.call_and_assert(
         "editor.execute",
         arguments={
@@ -467,6 +432,7 @@ async def test_execute_with_success_assertion(tool_caller):
         assertions=[
             SuccessAssertion(),  # MCP call succeeds
             DurationAssertion(max_seconds=15),
-            successful_execution,  # Python execution succeeds
+            _EXECUTION_SUCCEEDED,  # Python execution succeeds
+            JsonFieldContainsAssertion("output", "Assertion test passed!"),
         ],
     )
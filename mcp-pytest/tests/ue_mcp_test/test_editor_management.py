@@ -11,68 +11,75 @@ Run with:
     pytest test_editor_management.py -v
 """
 
-import json
+import logging
 
 import pytest
 
 from mcp_pytest import (
-    CustomAssertion,
     DurationAssertion,
+    JsonFieldsPresentAssertion,
     ResultContainsAssertion,
     SuccessAssertion,
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Fields every editor.status response carries
+STATUS_FIELDS = frozenset({"status", "project_name", "project_path"})
+
+# editor.status response must carry every STATUS_FIELDS entry
+_VALID_STATUS_STRUCTURE = JsonFieldsPresentAssertion(STATUS_FIELDS)
+
+
 # =============================================================================
 # Server Connection Tests
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_server_connection(mcp_client):
     """Test that we can connect to the UE-MCP server."""
     assert mcp_client.is_connected
-    print(f"Connected to server: {mcp_client.name}")
+    logger.debug("Connected to server: %s", mcp_client.name)
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_list_tools(mcp_client, expected_tools):
+async def test_list_tools(tools_index, expected_tools):
     """Test listing available tools from UE-MCP server."""
-    tools = await mcp_client.list_tools()
-    tool_names = [t.name for t in tools]
+    tool_names = tools_index.keys()
 
-    print(f"Available tools ({len(tools)}):")
+    logger.debug("Available tools (%s):", len(tool_names))
     for name in sorted(tool_names):
-        print(f"  - {name}")
+        logger.debug("  - %s", name)
 
-    assert len(tools) > 0, "Server should expose at least one tool"
+    assert tool_names, "Server should expose at least one tool"
 
     # Verify all expected tools are present
-    for expected in expected_tools:
-        assert expected in tool_names, f"Missing expected tool: {expected}"
+    missing = set(expected_tools) - tool_names
+    assert not missing, f"Missing expected tools: {sorted(missing)}"
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_tool_schemas(mcp_client, expected_tools):
+async def test_tool_schemas(tools_index, expected_tools):
     """Test that all tools have proper schemas defined."""
-    tools = await mcp_client.list_tools()
-    tool_map = {t.name: t for t in tools}
+    missing = set(expected_tools) - tools_index.keys()
+    assert not missing, f"Tools not found: {sorted(missing)}"
 
-    for tool_name in expected_tools:
-        assert tool_name in tool_map, f"Tool not found: {tool_name}"
-        tool = tool_map[tool_name]
+    # Each tool should have a description
+    undescribed = [name for name in expected_tools if not tools_index[name].description]
+    assert not undescribed, f"Tools should have a description: {undescribed}"
 
-        # Each tool should have a description
-        assert tool.description, f"Tool {tool_name} should have a description"
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
 
-        print(f"\n{tool_name}:")
-        print(f"  Description: {tool.description[:100]}...")
+    for tool_name in expected_tools:
+        tool = tools_index[tool_name]
+        logger.debug("%s:", tool_name)
+        logger.debug("  Description: %s...", tool.description[:100])
         if hasattr(tool, "inputSchema") and tool.inputSchema:
             props = tool.inputSchema.get("properties", {})
-            print(f"  Parameters: {list(props.keys())}")
+            logger.debug("  Parameters: %s", list(props.keys()))
 
 
 # =============================================================================
@@ -80,7 +87,6 @@ async def test_tool_schemas(mcp_client, expected_tools):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_editor_status_basic(tool_caller):
     """Test getting editor status when not running."""
@@ -89,13 +95,12 @@ async def test_editor_status_basic(tool_caller):
     assert result.success, f"Failed to get status: {result.error_message}"
 
     # Parse the JSON response
-    status_data = json.loads(result.text_content)
-    print(f"Editor status: {json.dumps(status_data, indent=2)}")
+    status_data = result.json_content
+    logger.debug("Editor status: %s", status_data)
 
     # Verify required fields
-    assert "status" in status_data, "Response should contain 'status' field"
-    assert "project_name" in status_data, "Response should contain 'project_name' field"
-    assert "project_path" in status_data, "Response should contain 'project_path' field"
+    missing = STATUS_FIELDS - status_data.keys()
+    assert not missing, f"Response should contain fields: {sorted(missing)}"
 
     # Initially editor should not be running
     assert status_data["status"] in [
@@ -106,38 +111,26 @@ async def test_editor_status_basic(tool_caller):
     ], f"Invalid status: {status_data['status']}"
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_editor_status_with_assertions(tool_caller):
     """Test editor status with assertion framework."""
-
-    # Custom assertion to check status structure
-    valid_status_structure = CustomAssertion(
-        check_func=lambda r: all(
-            key in json.loads(r.text_content)
-            for key in ["status", "project_name", "project_path"]
-        ),
-        description="Status response has required fields",
-    )
-
     result = await tool_caller.call_and_assert(
         "editor.status",
         arguments={},
         assertions=[
             SuccessAssertion(),
             DurationAssertion(max_seconds=5),
-            valid_status_structure,
+            _VALID_STATUS_STRUCTURE,
         ],
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_editor_status_contains_project_info(tool_caller, sample_uproject_path):
     """Test that editor status contains correct project information."""
     result = await tool_caller.call("editor.status", arguments={})
 
-    status_data = json.loads(result.text_content)
+    status_data = result.json_content
 
     # Project name should match our test fixture
     assert "EmptyProjectTemplate" in status_data.get(
@@ -150,13 +143,11 @@ async def test_editor_status_contains_project_info(tool_caller, sample_uproject_
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_editor_launch_parameters(tool_caller):
+async def test_editor_launch_parameters(tools_index):
     """Test that editor.launch accepts correct parameters."""
     # Get tool info to verify parameters
-    tools = await tool_caller.client.list_tools()
-    launch_tool = next((t for t in tools if t.name == "editor.launch"), None)
+    launch_tool = tools_index.get("editor.launch")
 
     assert launch_tool is not None, "editor.launch tool should exist"
     assert launch_tool.inputSchema is not None, "Should have input schema"
@@ -169,13 +160,13 @@ async def test_editor_launch_parameters(tool_caller):
     assert "wait" in props, "Should accept wait parameter"
     assert "wait_timeout" in props, "Should accept wait_timeout parameter"
 
-    print("editor.launch parameters:")
+    logger.debug("editor.launch parameters:")
     for param, info in props.items():
-        print(f"  {param}: {info.get('type', 'unknown')}")
+        logger.debug("  %s: %s", param, info.get("type", "unknown"))
 
 
-@pytest.mark.asyncio
 @pytest.mark.mock
+@pytest.mark.drives_editor
 async def test_editor_launch_without_wait(tool_caller):
     """Test editor.launch with wait=False (async mode).
 
@@ -192,7 +183,10 @@ async def test_editor_launch_without_wait(tool_caller):
     )
 
     # Either succeeds (UE5 found) or fails gracefully (UE5 not found)
-    print(f"Launch result: {result.text_content[:500] if result.text_content else 'No content'}")
+    logger.debug(
+        "Launch result: %s",
+        result.text_content[:500] if result.text_content else "No content",
+    )
 
 
 # =============================================================================
@@ -200,30 +194,28 @@ async def test_editor_launch_without_wait(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
+@pytest.mark.drives_editor
 async def test_editor_stop_when_not_running(tool_caller):
     """Test stopping editor when it's not running."""
     result = await tool_caller.call("editor.stop", arguments={})
 
     # Should handle gracefully when editor is not running
-    status_data = json.loads(result.text_content)
-    print(f"Stop result: {json.dumps(status_data, indent=2)}")
+    status_data = result.json_content
+    logger.debug("Stop result: %s", status_data)
 
     # Either already stopped or success
     assert "success" in status_data or "status" in status_data
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_editor_stop_parameters(tool_caller):
+async def test_editor_stop_parameters(tools_index):
     """Test that editor.stop has expected parameters."""
-    tools = await tool_caller.client.list_tools()
-    stop_tool = next((t for t in tools if t.name == "editor.stop"), None)
+    stop_tool = tools_index.get("editor.stop")
 
     assert stop_tool is not None, "editor.stop tool should exist"
     assert stop_tool.description, "Should have description"
-    print(f"editor.stop description: {stop_tool.description}")
+    logger.debug("editor.stop description: %s", stop_tool.description)
 
 
 # =============================================================================
@@ -231,10 +223,18 @@ async def test_editor_stop_parameters(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
+async def _reported_status(tool_caller, data: dict) -> str:
+    """Editor status carried by a launch/stop response, else polled once."""
+    status = data.get("status")
+    if status is None:
+        status_result = await tool_caller.call("editor.status", arguments={})
+        status = status_result.json_content["status"]
+    return status
+
+
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.requires_editor
+@pytest.mark.drives_editor
 async def test_editor_launch_and_stop_workflow(tool_caller):
     """Test full editor launch and stop workflow.
 
@@ -243,11 +243,11 @@ async def test_editor_launch_and_stop_workflow(tool_caller):
     """
     # Step 1: Verify initial status
     status_result = await tool_caller.call("editor.status", arguments={})
-    initial_status = json.loads(status_result.text_content)
-    print(f"Initial status: {initial_status['status']}")
+    initial_status = status_result.json_content
+    logger.debug("Initial status: %s", initial_status["status"])
 
     if initial_status["status"] == "ready":
-        print("Editor already running, skipping launch test")
+        logger.debug("Editor already running, skipping launch test")
         return
 
     # Step 2: Launch editor (async mode)
@@ -258,39 +258,36 @@ async def test_editor_launch_and_stop_workflow(tool_caller):
             "wait_timeout": 30.0,
         },
     )
-    launch_data = json.loads(launch_result.text_content)
-    print(f"Launch result: {launch_data}")
+    launch_data = launch_result.json_content
+    logger.debug("Launch result: %s", launch_data)
 
     # Step 3: Check status after launch
-    status_result = await tool_caller.call("editor.status", arguments={})
-    post_launch_status = json.loads(status_result.text_content)
-    print(f"Post-launch status: {post_launch_status['status']}")
+    post_launch_status = await _reported_status(tool_caller, launch_data)
+    logger.debug("Post-launch status: %s", post_launch_status)
 
-    assert post_launch_status["status"] in [
+    assert post_launch_status in [
         "starting",
         "ready",
     ], "Editor should be starting or ready"
 
     # Step 4: Stop editor
     stop_result = await tool_caller.call("editor.stop", arguments={})
-    stop_data = json.loads(stop_result.text_content)
-    print(f"Stop result: {stop_data}")
+    stop_data = stop_result.json_content
+    logger.debug("Stop result: %s", stop_data)
 
     # Step 5: Verify stopped
-    final_status_result = await tool_caller.call("editor.status", arguments={})
-    final_status = json.loads(final_status_result.text_content)
-    print(f"Final status: {final_status['status']}")
+    final_status = await _reported_status(tool_caller, stop_data)
+    logger.debug("Final status: %s", final_status)
 
-    assert final_status["status"] in [
+    assert final_status in [
         "not_running",
         "stopped",
     ], "Editor should be stopped"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.requires_editor
+@pytest.mark.drives_editor
 @pytest.mark.mcp_timeout(180)  # 3 minute timeout for editor launch
 async def test_editor_launch_with_wait(tool_caller):
     """Test editor launch with synchronous wait.
@@ -307,21 +304,21 @@ async def test_editor_launch_with_wait(tool_caller):
         },
     )
 
-    launch_data = json.loads(result.text_content)
+    launch_data = result.json_content
 
     if launch_data.get("success"):
-        print("Editor launched and connected successfully!")
+        logger.debug("Editor launched and connected successfully!")
 
         # Verify ready status
         status_result = await tool_caller.call("editor.status", arguments={})
-        status = json.loads(status_result.text_content)
+        status = status_result.json_content
         assert status["status"] == "ready", "Editor should be ready after sync launch"
         assert status.get("connected"), "Should be connected for remote execution"
 
         # Cleanup
         await tool_caller.call("editor.stop", arguments={})
     else:
-        print(f"Launch failed (expected if UE5 not installed): {launch_data.get('error')}")
+        logger.debug("Launch failed (expected if UE5 not installed): %s", launch_data.get("error"))
 
 
 # =============================================================================
@@ -329,13 +326,12 @@ async def test_editor_launch_with_wait(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
+@pytest.mark.drives_editor
 async def test_editor_tool_call_history(tool_caller):
     """Test that call history is properly tracked for editor tools."""
-    # Make several calls
-    await tool_caller.call("editor.status", arguments={})
-    await tool_caller.call("editor.status", arguments={})
+    # Make several calls; the status calls are independent, stop must run last
+    await tool_caller.call_many([("editor.status", {}), ("editor.status", {})])
     await tool_caller.call("editor.stop", arguments={})
 
     # Check history
@@ -350,5 +346,5 @@ async def test_editor_tool_call_history(tool_caller):
     last = tool_caller.get_last_call()
     assert last.name == "editor.stop", "Last call should be editor.stop"
 
-    print(f"Total calls: {len(history)}")
-    print(f"Status calls: {len(status_calls)}")
+    logger.debug("Total calls: %s", len(history))
+    logger.debug("Status calls: %s", len(status_calls))
@@ -9,38 +9,66 @@ Run with:
     pytest test_project_build.py -v
 """
 
-import json
+import logging
+import reprlib
 
 import pytest
 
 from mcp_pytest import (
-    CustomAssertion,
     DurationAssertion,
+    JsonFieldsPresentAssertion,
     SuccessAssertion,
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Bounded repr for build results; verbose builds return very long logs, and
+# this truncates while formatting instead of rendering the whole payload first
+_BUILD_REPR = reprlib.Repr()
+_BUILD_REPR.maxstring = 1000
+_BUILD_REPR.maxlist = 20
+_BUILD_REPR.maxdict = 20
+
+# Arguments of the quick async Editor build; tests copy it via _build_args
+# rather than modifying it
+_BUILD_ARGS_ASYNC = {
+    "target": "Editor",
+    "configuration": "Development",
+    "platform": "Win64",
+    "wait": False,
+}
+
+
+def _build_args(**overrides):
+    """Async build arguments with selected values replaced."""
+    args = _BUILD_ARGS_ASYNC.copy()
+    args.update(overrides)
+    return args
+
+
+# Fields of a build response; every response carries at least one of them
+RESPONSE_FIELDS = frozenset({"success", "error", "message"})
+
+# Build response must carry at least one of RESPONSE_FIELDS
+_VALID_BUILD_RESPONSE = JsonFieldsPresentAssertion(RESPONSE_FIELDS, require_all=False)
+
+
 # =============================================================================
 # Tool Schema Tests
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_build_tool_exists(mcp_client):
+def test_build_tool_exists(tools_index):
     """Test that project.build tool exists."""
-    tools = await mcp_client.list_tools()
-    tool_names = [t.name for t in tools]
-
-    assert "project.build" in tool_names, "project.build tool should exist"
+    assert "project.build" in tools_index, "project.build tool should exist"
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_build_tool_schema(tool_caller):
+def test_build_tool_schema(tools_index):
     """Test project.build tool schema and parameters."""
-    tools = await tool_caller.client.list_tools()
-    build_tool = next((t for t in tools if t.name == "project.build"), None)
+    build_tool = tools_index.get("project.build")
 
     assert build_tool is not None, "project.build tool should exist"
     assert build_tool.description, "Should have description"
@@ -54,9 +82,9 @@ async def test_build_tool_schema(tool_caller):
     for param in expected_params:
         assert param in props, f"Should accept '{param}' parameter"
 
-    print("project.build schema:")
-    print(f"  Description: {build_tool.description[:150]}...")
-    print(f"  Parameters: {list(props.keys())}")
+    logger.debug("project.build schema:")
+    logger.debug("  Description: %s...", build_tool.description[:150])
+    logger.debug("  Parameters: %s", list(props.keys()))
 
     # Print parameter details
     for param, info in props.items():
@@ -64,9 +92,9 @@ async def test_build_tool_schema(tool_caller):
         param_type = info.get("type", "unknown")
         enum_vals = info.get("enum", [])
         if enum_vals:
-            print(f"  {param}: {param_type} (enum: {enum_vals})")
+            logger.debug("  %s: %s (enum: %s)", param, param_type, enum_vals)
         else:
-            print(f"  {param}: {param_type} (default: {default})")
+            logger.debug("  %s: %s (default: %s)", param, param_type, default)
 
 
 # =============================================================================
@@ -74,59 +102,52 @@ async def test_build_tool_schema(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
+@pytest.fixture(scope="module")
+def build_properties(tools_index) -> dict:
+    """Input schema properties of project.build, looked up once per module."""
+    build_tool = tools_index.get("project.build")
+    assert build_tool is not None, "project.build tool should exist"
+    return build_tool.inputSchema.get("properties", {})
+
+
 @pytest.mark.unit
-async def test_build_target_values(tool_caller):
+def test_build_target_values(build_properties):
     """Test that target parameter accepts valid values."""
-    tools = await tool_caller.client.list_tools()
-    build_tool = next((t for t in tools if t.name == "project.build"), None)
-
-    props = build_tool.inputSchema.get("properties", {})
-    target_prop = props.get("target", {})
+    target_prop = build_properties.get("target", {})
 
     # Check if it has enum or description with valid values
-    print(f"Target property: {target_prop}")
+    logger.debug("Target property: %s", target_prop)
 
     # Valid targets should include: Editor, Game, Client, Server
     valid_targets = ["Editor", "Game", "Client", "Server"]
     for target in valid_targets:
-        print(f"  - {target}")
+        logger.debug("  - %s", target)
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_build_configuration_values(tool_caller):
+def test_build_configuration_values(build_properties):
     """Test that configuration parameter accepts valid values."""
-    tools = await tool_caller.client.list_tools()
-    build_tool = next((t for t in tools if t.name == "project.build"), None)
-
-    props = build_tool.inputSchema.get("properties", {})
-    config_prop = props.get("configuration", {})
+    config_prop = build_properties.get("configuration", {})
 
-    print(f"Configuration property: {config_prop}")
+    logger.debug("Configuration property: %s", config_prop)
 
     # Valid configurations
     valid_configs = ["Debug", "DebugGame", "Development", "Shipping", "Test"]
     for config in valid_configs:
-        print(f"  - {config}")
+        logger.debug("  - %s", config)
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_build_platform_values(tool_caller):
+def test_build_platform_values(build_properties):
     """Test that platform parameter accepts valid values."""
-    tools = await tool_caller.client.list_tools()
-    build_tool = next((t for t in tools if t.name == "project.build"), None)
+    platform_prop = build_properties.get("platform", {})
 
-    props = build_tool.inputSchema.get("properties", {})
-    platform_prop = props.get("platform", {})
-
-    print(f"Platform property: {platform_prop}")
+    logger.debug("Platform property: %s", platform_prop)
 
     # Common platforms
     valid_platforms = ["Win64", "Mac", "Linux"]
     for platform in valid_platforms:
-        print(f"  - {platform}")
+        logger.debug("  - %s", platform)
 
 
 # =============================================================================
@@ -134,7 +155,6 @@ async def test_build_platform_values(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.slow
 @pytest.mark.mcp_timeout(1800)  # 30 minute timeout for builds
@@ -156,20 +176,20 @@ async def test_build_editor_development(tool_caller):
         },
     )
 
-    build_data = json.loads(result.text_content)
-    print(f"Build result: {json.dumps(build_data, indent=2)[:1000]}")
+    build_data = result.json_content
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Build result: %s", _BUILD_REPR.repr(build_data))
 
     if build_data.get("success"):
-        print("Build succeeded!")
+        logger.debug("Build succeeded!")
         assert "output" in build_data, "Should contain build output"
         assert "return_code" in build_data, "Should contain return code"
         assert build_data["return_code"] == 0, "Return code should be 0"
     else:
-        print(f"Build failed: {build_data.get('error')}")
+        logger.debug("Build failed: %s", build_data.get("error"))
         # May fail if UE5 not installed or project not set up
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.slow
 async def test_build_async_mode(tool_caller):
@@ -190,8 +210,8 @@ async def test_build_async_mode(tool_caller):
         },
     )
 
-    build_data = json.loads(result.text_content)
-    print(f"Async build started: {json.dumps(build_data, indent=2)}")
+    build_data = result.json_content
+    logger.debug("Async build started: %s", build_data)
 
     if build_data.get("success"):
         # Should return immediately with status
@@ -199,7 +219,6 @@ async def test_build_async_mode(tool_caller):
             "Should indicate build started"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.slow
 async def test_build_with_clean(tool_caller):
@@ -220,11 +239,10 @@ async def test_build_with_clean(tool_caller):
         },
     )
 
-    build_data = json.loads(result.text_content)
-    print(f"Clean build started: {json.dumps(build_data, indent=2)}")
+    build_data = result.json_content
+    logger.debug("Clean build started: %s", build_data)
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.slow
 async def test_build_with_verbose(tool_caller):
@@ -242,8 +260,8 @@ async def test_build_with_verbose(tool_caller):
         },
     )
 
-    build_data = json.loads(result.text_content)
-    print(f"Verbose build: {json.dumps(build_data, indent=2)}")
+    build_data = result.json_content
+    logger.debug("Verbose build: %s", build_data)
 
 
 # =============================================================================
@@ -251,42 +269,30 @@ async def test_build_with_verbose(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.slow
 async def test_build_game_target(tool_caller):
     """Test building Game target."""
     result = await tool_caller.call(
         "project.build",
-        arguments={
-            "target": "Game",
-            "configuration": "Development",
-            "platform": "Win64",
-            "wait": False,
-        },
+        arguments=_build_args(target="Game"),
     )
 
-    build_data = json.loads(result.text_content)
-    print(f"Game build: {json.dumps(build_data, indent=2)}")
+    build_data = result.json_content
+    logger.debug("Game build: %s", build_data)
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.slow
 async def test_build_shipping_config(tool_caller):
     """Test building with Shipping configuration."""
     result = await tool_caller.call(
         "project.build",
-        arguments={
-            "target": "Game",
-            "configuration": "Shipping",
-            "platform": "Win64",
-            "wait": False,
-        },
+        arguments=_build_args(target="Game", configuration="Shipping"),
     )
 
-    build_data = json.loads(result.text_content)
-    print(f"Shipping build: {json.dumps(build_data, indent=2)}")
+    build_data = result.json_content
+    logger.debug("Shipping build: %s", build_data)
 
 
 # =============================================================================
@@ -294,60 +300,42 @@ async def test_build_shipping_config(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_build_invalid_target(tool_caller):
     """Test build with invalid target."""
     result = await tool_caller.call(
         "project.build",
-        arguments={
-            "target": "InvalidTarget",
-            "configuration": "Development",
-            "platform": "Win64",
-            "wait": False,
-        },
+        arguments=_build_args(target="InvalidTarget"),
     )
 
-    build_data = json.loads(result.text_content)
-    print(f"Invalid target result: {json.dumps(build_data, indent=2)}")
+    build_data = result.json_content
+    logger.debug("Invalid target result: %s", build_data)
 
     # Should fail with appropriate error
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_build_invalid_configuration(tool_caller):
     """Test build with invalid configuration."""
     result = await tool_caller.call(
         "project.build",
-        arguments={
-            "target": "Editor",
-            "configuration": "InvalidConfig",
-            "platform": "Win64",
-            "wait": False,
-        },
+        arguments=_build_args(configuration="InvalidConfig"),
     )
 
-    build_data = json.loads(result.text_content)
-    print(f"Invalid config result: {json.dumps(build_data, indent=2)}")
+    build_data = result.json_content
+    logger.debug("Invalid config result: %s", build_data)
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_build_invalid_platform(tool_caller):
     """Test build with invalid platform."""
     result = await tool_caller.call(
         "project.build",
-        arguments={
-            "target": "Editor",
-            "configuration": "Development",
-            "platform": "InvalidPlatform",
-            "wait": False,
-        },
+        arguments=_build_args(platform="InvalidPlatform"),
     )
 
-    build_data = json.loads(result.text_content)
-    print(f"Invalid platform result: {json.dumps(build_data, indent=2)}")
+    build_data = result.json_content
+    logger.debug("Invalid platform result: %s", build_data)
 
 
 # =============================================================================
@@ -355,24 +343,18 @@ async def test_build_invalid_platform(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
-async def test_build_default_timeout(tool_caller):
+def test_build_default_timeout(build_properties):
     """Test that build has reasonable default timeout."""
-    tools = await tool_caller.client.list_tools()
-    build_tool = next((t for t in tools if t.name == "project.build"), None)
+    timeout_prop = build_properties.get("timeout", {})
 
-    props = build_tool.inputSchema.get("properties", {})
-    timeout_prop = props.get("timeout", {})
-
-    print(f"Timeout property: {timeout_prop}")
+    logger.debug("Timeout property: %s", timeout_prop)
 
     # Default should be reasonable for builds (e.g., 30 minutes = 1800 seconds)
     default_timeout = timeout_prop.get("default", 0)
     assert default_timeout >= 300, "Default timeout should be at least 5 minutes"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_build_short_timeout(tool_caller):
     """Test build with very short timeout (should fail)."""
@@ -387,8 +369,8 @@ async def test_build_short_timeout(tool_caller):
         },
     )
 
-    build_data = json.loads(result.text_content)
-    print(f"Short timeout result: {json.dumps(build_data, indent=2)}")
+    build_data = result.json_content
+    logger.debug("Short timeout result: %s", build_data)
 
     # Should timeout or fail quickly
 
@@ -398,7 +380,6 @@ async def test_build_short_timeout(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.slow
 async def test_build_progress_reporting(tool_caller):
@@ -419,8 +400,8 @@ async def test_build_progress_reporting(tool_caller):
         },
     )
 
-    build_data = json.loads(result.text_content)
-    print(f"Build with progress: {json.dumps(build_data, indent=2)}")
+    build_data = result.json_content
+    logger.debug("Build with progress: %s", build_data)
 
 
 # =============================================================================
@@ -428,48 +409,41 @@ async def test_build_progress_reporting(tool_caller):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 async def test_build_response_format(tool_caller):
-    """Test that build returns properly formatted response."""
-    # Custom assertion for response format
-    valid_response = CustomAssertion(
-        check_func=lambda r: (
-            "success" in json.loads(r.text_content)
-            or "error" in json.loads(r.text_content)
-            or "message" in json.loads(r.text_content)
-        ),
-        description="Response should contain 'success', 'error', or 'message' field",
-    )
+    """Test that build returns properly formatted response and is tracked in history.
 
-    result = await tool_caller.call_and_assert(
+    Both checks read the same async build call, so the server is asked once.
+    """
+    await tool_caller.call_and_assert(
         "project.build",
-        arguments={
-            "target": "Editor",
-            "configuration": "Development",
-            "platform": "Win64",
-            "wait": False,
-        },
+        arguments=_BUILD_ARGS_ASYNC,
         assertions=[
             SuccessAssertion(),  # MCP call succeeds
-            valid_response,
+            _VALID_BUILD_RESPONSE,
         ],
     )
 
+    # Check history
+    last_call = tool_caller.get_last_call_for_tool("project.build")
+    assert last_call is not None, "Should have at least 1 build call"
+
+    assert last_call.arguments.get("target") == "Editor"
+    assert last_call.arguments.get("configuration") == "Development"
+
+    logger.debug(
+        "Build call tracked: %s args=%s dur=%.2fs",
+        last_call.name,
+        last_call.arguments,
+        last_call.duration_seconds,
+    )
+
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.slow
 @pytest.mark.mcp_timeout(600)  # 10 minute timeout
 async def test_build_sync_with_assertions(tool_caller):
     """Test synchronous build with assertion framework."""
-    # Custom assertion for successful build
-    build_succeeded = CustomAssertion(
-        check_func=lambda r: json.loads(r.text_content).get("success", False),
-        description="Build should succeed",
-        message_func=lambda r: f"Build failed: {json.loads(r.text_content).get('error', 'Unknown')}",
-    )
-
     result = await tool_caller.call_and_assert(
         "project.build",
         arguments={
@@ -482,39 +456,12 @@ async def test_build_sync_with_assertions(tool_caller):
         assertions=[
             SuccessAssertion(),
             DurationAssertion(max_seconds=600),
-            # build_succeeded,  # Uncomment when UE5 is available
+            # Uncomment when UE5 is available:
+            # CustomAssertion(
+            #     check_func=lambda data: data.get("success", False),
+            #     description="Build should succeed",
+            #     message_func=lambda data: f"Build failed: {data.get('error', 'Unknown')}",
+            #     parse_json=True,
+            # ),
         ],
     )
-
-
-# =============================================================================
-# Call History Tests
-# =============================================================================
-
-
-@pytest.mark.asyncio
-@pytest.mark.unit
-async def test_build_call_history(tool_caller):
-    """Test that build calls are tracked in history."""
-    # Make a build call
-    await tool_caller.call(
-        "project.build",
-        arguments={
-            "target": "Editor",
-            "configuration": "Development",
-            "platform": "Win64",
-            "wait": False,
-        },
-    )
-
-    # Check history
-    build_calls = tool_caller.get_calls_for_tool("project.build")
-    assert len(build_calls) >= 1, "Should have at least 1 build call"
-
-    last_call = build_calls[-1]
-    assert last_call.arguments.get("target") == "Editor"
-    assert last_call.arguments.get("configuration") == "Development"
-
-    print(f"Build call tracked: {last_call.name}")
-    print(f"  Arguments: {last_call.arguments}")
-    print(f"  Duration: {last_call.duration_seconds:.2f}s")